@@ -22,6 +22,7 @@ a = Analysis(
     ],
     hiddenimports=[
         'PySide6',
+        'qasync',
         'core',
         'ui',
         'src_list',
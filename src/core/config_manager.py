@@ -1,8 +1,10 @@
 import json
 import os
+import copy
 import logging
+import threading
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 class ConfigManager:
     """
@@ -12,8 +14,13 @@ class ConfigManager:
     - 設定更新メソッドの追加（update_config）
     - 最近使用したデータベースの管理機能
     - アクティブなデータベースパスの記憶機能
+    - 読み込んだJSONファイルのキャッシュ（更新時刻で無効化、インスタンス間で共有）
     """
     
+    # ファイルパス -> ((st_mtime_ns, st_size), 読み込んだデータ)
+    _json_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+    _json_cache_lock = threading.Lock()
+    
     def __init__(self):
         """初期化"""
         self.logger = logging.getLogger(__name__)
@@ -77,22 +84,38 @@ class ConfigManager:
             self._save_json(self.config_file, self._config)
     
     def _load_json(self, file_path: Path) -> dict:
-        """JSONファイルを読み込む"""
+        """JSONファイルを読み込む（ファイルが更新されていなければキャッシュを返す）"""
         try:
-            if not file_path.exists():
+            try:
+                st = os.stat(file_path)
+            except FileNotFoundError:
                 return {}
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            stamp = (st.st_mtime_ns, st.st_size)
+            key = str(file_path)
+            
+            with self._json_cache_lock:
+                cached = self._json_cache.get(key)
+                if cached is None or cached[0] != stamp:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        data = json.load(f)
+                    cached = (stamp, data)
+                    self._json_cache[key] = cached
+                # 呼び出し側で変更されてもキャッシュが壊れないようコピーを返す
+                return copy.deepcopy(cached[1])
         except Exception as e:
-            print(f"設定ファイルの読み込みに失敗しました: {file_path} - {str(e)}")
+            self.logger.error(f"設定ファイルの読み込みに失敗しました: {file_path} - {str(e)}")
             return {}
     
     def _save_json(self, file_path: Path, data: dict):
         """JSONファイルを保存する"""
         try:
             self.logger.debug(f"JSONファイル保存開始: {file_path}")
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            with self._json_cache_lock:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, ensure_ascii=False, indent=4)
+                # 保存した内容でキャッシュを更新（直後の読み込みで再パースしない）
+                st = os.stat(file_path)
+                self._json_cache[str(file_path)] = ((st.st_mtime_ns, st.st_size), copy.deepcopy(data))
             self.logger.debug(f"JSONファイル保存完了")
         except Exception as e:
             self.logger.error(f"JSONファイル保存エラー: {file_path} - {str(e)}")
@@ -126,10 +149,13 @@ class ConfigManager:
             self.logger.error(f"設定更新中にエラーが発生しました: {str(e)}", exc_info=True)
     
     def get_recent_databases(self) -> list:
-        """最近使用したデータベースのリストを取得"""
-        recent_dbs = self._config.get("recent_databases", [])
-        self.logger.debug(f"get_recent_databases: {recent_dbs}")
-        return recent_dbs
+        """
+        最近使用したデータベースのリストを取得
+        
+        他のインスタンス（Databaseが持つConfigManager等）による更新も反映するため設定ファイルから取得する
+        （ファイルが更新されていなければ再パースせず、キャッシュから返す）
+        """
+        return self._load_json(self.config_file).get("recent_databases", [])
     
     def set_active_database(self, db_path: str):
         """
@@ -147,6 +173,27 @@ class ConfigManager:
         self._save_json(self.config_file, self._config)
         self.logger.debug(f"アクティブデータベース設定完了、最近使用したDBリスト: {self._config.get('recent_databases', [])}")
     
+    def switch_database(self, db_path: str, max_recent: int = 10):
+        """
+        データベースの切り替えを記録する（設定ファイルの読み込み・保存は1回ずつ）
+        
+        最近使用したDBリストの先頭に追加し、アクティブなデータベースに設定する
+        
+        Args:
+            db_path: データベースファイルのパス
+            max_recent: 最近使用したDBリストの最大件数
+        """
+        self.logger.debug(f"データベース切り替えを記録: {db_path}")
+        self._config = self._load_json(self.config_file)
+        
+        recent_dbs = [path for path in self._config.get("recent_databases", []) if path != db_path]
+        recent_dbs.insert(0, db_path)
+        self._config["recent_databases"] = recent_dbs[:max_recent]
+        self._config["active_database"] = db_path
+        
+        self._save_json(self.config_file, self._config)
+        self.logger.debug(f"データベース切り替えの記録完了、最近使用したDBリスト: {self._config['recent_databases']}")
+    
     def get_active_database(self) -> str:
         """
         現在アクティブなデータベースのパスを取得
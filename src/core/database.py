@@ -1,12 +1,28 @@
 import sqlite3
 import logging
+import threading
+import itertools
 import json
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional, Union, Any
+from typing import List, Dict, Optional, Union, Any, Set
 from src.core.config_manager import ConfigManager
 from src.core.constants import VideoStatus
 
+# 接続ごとにキャッシュするプリペアドステートメント数
+SQL_CACHED_STATEMENTS = 128
+
+# IN句に渡すパラメータ数の上限（古いSQLiteのSQLITE_MAX_VARIABLE_NUMBER=999未満に抑える）
+SQL_IN_CHUNK_SIZE = 500
+
+# モーションリストの一覧が読む解析結果のカラムと、移行時に値を取り出すresult_jsonのキー
+ANALYSIS_LIST_COLUMNS = {
+    "animation_name": '$."Name of AnimationFile"',
+    "character_gender": "$.character_gender",
+    "character_age_group": "$.character_age_group",
+    "character_body_type": "$.character_body_type",
+}
+
 class Database:
     """
     データベース管理クラス - 複数データベースファイル対応版
@@ -15,17 +31,23 @@ class Database:
     def __init__(self, db_path: Optional[str] = None):
         self.logger = logging.getLogger(__name__)
         self.config = ConfigManager()
+        # スレッドごとに使い回すSQLite接続
+        self._local = threading.local()
+        self._connection_ids = itertools.count(1)  # 開いた接続の通し番号（変更検知用）
+        # 登録済みの動画パス（重複チェックをSQLを発行せずに行うため）
+        self._known_paths: Set[str] = set()
         
         if db_path is None:
-            self.db_path = Path(self.config.get_paths()["db_path"])
+            self._set_db_path(self.config.get_paths()["db_path"])
         else:
-            self.db_path = Path(db_path)
+            self._set_db_path(db_path)
         
         # データベースディレクトリの作成
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
         # データベースの初期化
         self._init_database()
+        self._load_known_paths()
         
         self.logger.info(f"データベースを初期化しました: {self.db_path}")
     
@@ -92,6 +114,28 @@ class Database:
                 )
                 """)
                 
+                # 以前のバージョンで作成された解析結果テーブルには一覧表示用のカラムを追加する
+                self._ensure_analysis_columns(cursor)
+                
+                # 動画IDで関連データを引くためのインデックス
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_analysis_results_video_id ON analysis_results (video_id)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_tags_video_id ON tags (video_id)")
+                
+                # 動画を削除したら関連データもSQLite側でまとめて削除する
+                # （既存のDBファイルのテーブル定義は変更できないため、ON DELETE CASCADEではなくトリガーで実現）
+                cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS trg_videos_delete_children
+                AFTER DELETE ON videos
+                BEGIN
+                    DELETE FROM analysis_results WHERE video_id = OLD.id;
+                    DELETE FROM tags WHERE video_id = OLD.id;
+                END
+                """)
+                
+                # 以前のバージョンが作成したupdated_at更新用のトリガーを削除する
+                # （変更の検知はget_videos_signatureで行うため不要で、UPDATEのたびに余分な更新が走る）
+                cursor.execute("DROP TRIGGER IF EXISTS trg_videos_touch_updated_at")
+                
                 conn.commit()
                 self.logger.debug(f"データベーステーブルを初期化しました: {self.db_path}")
                 
@@ -99,12 +143,33 @@ class Database:
             self.logger.error(f"データベースの初期化中にエラーが発生しました: {str(e)}")
             raise
     
-    def change_database(self, new_db_path: str) -> bool:
+    def _ensure_analysis_columns(self, cursor):
+        """
+        analysis_resultsテーブルにアニメーション名・キャラクター情報の列がなければ追加する
+        
+        追加した列は、既存の行のresult_jsonの値で一度だけ埋める
+        """
+        cursor.execute("PRAGMA table_info(analysis_results)")
+        existing = {row[1] for row in cursor.fetchall()}
+        added = [column for column in ANALYSIS_LIST_COLUMNS if column not in existing]
+        if not added:
+            return
+        for column in added:
+            cursor.execute(f"ALTER TABLE analysis_results ADD COLUMN {column} TEXT DEFAULT NULL")
+            self.logger.info(f"analysis_resultsテーブルに{column}列を追加しました")
+        assignments = ", ".join(
+            f"{column} = json_extract(result_json, '{ANALYSIS_LIST_COLUMNS[column]}')" for column in added
+        )
+        cursor.execute(f"UPDATE analysis_results SET {assignments} WHERE json_valid(result_json)")
+    
+    def change_database(self, new_db_path: str, record_recent: bool = True) -> bool:
         """
         使用するデータベースファイルを変更する
         
         Args:
             new_db_path: 新しいデータベースファイルのパス
+            record_recent: 最近使用したDBリストを更新するか
+                （呼び出し側で設定ファイルをまとめて更新する場合はFalse）
             
         Returns:
             bool: 成功した場合はTrue、失敗した場合はFalse
@@ -113,16 +178,19 @@ class Database:
             # 現在のパスと同じ場合は何もしない
             if Path(new_db_path) == self.db_path:
                 return True
-                
-            self.db_path = Path(new_db_path)
+            
+            # 旧データベースへの接続を閉じてから切り替える
+            self.close()
+            self._set_db_path(new_db_path)
             self.db_path.parent.mkdir(parents=True, exist_ok=True)
             
-            # 新しいデータベースが存在しなければ初期化する
-            if not self.db_path.exists() or self.db_path.stat().st_size == 0:
-                self._init_database()
+            # テーブル・インデックス・トリガーを用意する（既存のDBでは不足分だけ作成される）
+            self._init_database()
+            self._load_known_paths()
             
             # 最近使用したDBリストを更新
-            self._update_recent_db_list(str(self.db_path))
+            if record_recent:
+                self._update_recent_db_list(str(self.db_path))
             
             self.logger.info(f"データベースを変更しました: {self.db_path}")
             return True
@@ -131,6 +199,17 @@ class Database:
             self.logger.error(f"データベース変更中にエラーが発生しました: {str(e)}")
             return False
     
+    def _load_known_paths(self):
+        """登録済みの動画パスをメモリに読み込む"""
+        try:
+            rows = self._get_connection().execute("SELECT file_path FROM videos").fetchall()
+            self._known_paths = {row[0] for row in rows}
+            self.logger.debug(f"登録済みパスを読み込みました: {len(self._known_paths)}件")
+            
+        except Exception as e:
+            self.logger.error(f"登録済みパスの読み込み中にエラーが発生しました: {str(e)}")
+            raise
+    
     def _update_recent_db_list(self, db_path: str):
         """最近使用したデータベースリストを更新する"""
         try:
@@ -188,16 +267,89 @@ class Database:
             self.logger.error(f"新しいデータベース作成中にエラーが発生しました: {str(e)}")
             return False
     
+    def _set_db_path(self, db_path: Union[str, Path]):
+        """データベースファイルのパスを設定し、文字列表現とファイル名をキャッシュする"""
+        self.db_path = Path(db_path)
+        self._cached_path = str(self.db_path)
+        self._cached_basename = self.db_path.name
+        # prompt_name列の有無（データベースごとに初回の問い合わせ結果を使い回す）
+        self._prompt_column_cache: Optional[bool] = None
+    
     def get_database_path(self) -> str:
         """現在のデータベースファイルのパスを取得する"""
-        return str(self.db_path)
+        return self._cached_path
+    
+    def get_database_name(self) -> str:
+        """現在のデータベースファイル名を取得する"""
+        return self._cached_basename
     
     def _get_connection(self):
-        """SQLite3データベース接続を取得 - パス動的変更対応版"""
-        return sqlite3.connect(self.db_path)
+        """
+        SQLite3データベース接続を取得 - パス動的変更対応版
+        
+        接続はスレッドごとに一度だけ開いて使い回す。
+        データベースファイルが変更された場合は開き直す。
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.db_path == self.db_path:
+            return conn
+        
+        self.close()
+        
+        conn = sqlite3.connect(self.db_path, cached_statements=SQL_CACHED_STATEMENTS)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-64000")
+        conn.execute("PRAGMA mmap_size=268435456")
+        self._local.conn = conn
+        self._local.db_path = self.db_path
+        self._local.conn_id = next(self._connection_ids)
+        return conn
+    
+    def close(self):
+        """
+        呼び出し元スレッドの接続を閉じる
+        
+        他のスレッドの接続は、次に使われた時にパスの変更を検知して開き直される
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+    
+    def _has_prompt_column(self, cursor) -> bool:
+        """videosテーブルにprompt_name列があるか（初回だけ問い合わせる）"""
+        if self._prompt_column_cache is None:
+            try:
+                cursor.execute("SELECT prompt_name FROM videos LIMIT 1")
+                self._prompt_column_cache = True
+            except sqlite3.OperationalError:
+                self._prompt_column_cache = False
+                self.logger.debug("videosテーブルにprompt_name列が存在しません")
+        return self._prompt_column_cache
+    
+    def _ensure_prompt_column(self, cursor):
+        """videosテーブルにprompt_name列がなければ追加する"""
+        if not self._has_prompt_column(cursor):
+            cursor.execute("ALTER TABLE videos ADD COLUMN prompt_name TEXT")
+            self._prompt_column_cache = True
+            self.logger.info("videosテーブルにprompt_name列を追加しました")
+    
+    @staticmethod
+    def _chunks(values: List, size: int = SQL_IN_CHUNK_SIZE):
+        """IN句用に値のリストを一定サイズごとに分割する"""
+        for start in range(0, len(values), size):
+            yield values[start:start + size]
     
     def add_video(self, file_path: str) -> int:
         """新しい動画ファイルをデータベースに追加"""
+        # 登録済みの動画（再処理など）はINSERTを失敗させずにIDだけ引く
+        if file_path in self._known_paths:
+            video_id = self.get_video_id_by_path(file_path)
+            if video_id is not None:
+                return video_id
+        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
@@ -212,6 +364,7 @@ class Database:
                 
                 video_id = cursor.lastrowid
                 conn.commit()
+                self._known_paths.add(file_path)
                 
                 self.logger.info(f"動画が追加されました: {file_path}")
                 return video_id
@@ -225,6 +378,68 @@ class Database:
             self.logger.error(f"動画の追加中にエラーが発生しました: {str(e)}")
             raise
     
+    def get_video_id_by_path(self, file_path: str) -> Optional[int]:
+        """
+        パスから動画IDを取得する（未登録の場合はNone）
+        
+        同じSQL文字列を使い回すため、接続のステートメントキャッシュが効く
+        """
+        try:
+            row = self._get_connection().execute(
+                "SELECT id FROM videos WHERE file_path = ?", (file_path,)
+            ).fetchone()
+            return row[0] if row else None
+            
+        except Exception as e:
+            self.logger.error(f"動画IDの取得中にエラーが発生しました: {str(e)}")
+            raise
+    
+    def is_known_path(self, file_path: str) -> bool:
+        """動画パスが既にデータベースに登録されているか（メモリ上の集合で判定）"""
+        return file_path in self._known_paths
+    
+    def add_videos_bulk(self, file_paths: List[str]) -> List[int]:
+        """
+        複数の動画ファイルを1つのトランザクションでデータベースに追加
+        
+        Args:
+            file_paths: 追加する動画ファイルのパスのリスト
+            
+        Returns:
+            List[int]: file_pathsと同じ順序の動画ID（既存の場合は既存のID）
+        """
+        if not file_paths:
+            return []
+        
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.executemany("""
+                INSERT OR IGNORE INTO videos (file_path, file_name)
+                VALUES (?, ?)
+                """, [(file_path, Path(file_path).name) for file_path in file_paths])
+                
+                # 追加した動画のIDをまとめて取得
+                ids_by_path = {}
+                for chunk in self._chunks(file_paths):
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(
+                        f"SELECT id, file_path FROM videos WHERE file_path IN ({placeholders})",
+                        chunk
+                    )
+                    ids_by_path.update((path, video_id) for video_id, path in cursor.fetchall())
+                
+                conn.commit()
+                self._known_paths.update(file_paths)
+                
+                self.logger.info(f"{len(file_paths)}件の動画が追加されました")
+                return [ids_by_path[file_path] for file_path in file_paths]
+                
+        except Exception as e:
+            self.logger.error(f"動画の一括追加中にエラーが発生しました: {str(e)}")
+            raise
+    
     def update_video_status(self, video_id: int, status: str, progress: int = None):
         """動画の状態と進捗を更新"""
         try:
@@ -373,11 +588,10 @@ class Database:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                for tag in tags:
-                    cursor.execute("""
-                    INSERT INTO tags (video_id, tag, source)
-                    VALUES (?, ?, ?)
-                    """, (video_id, tag, source))
+                cursor.executemany("""
+                INSERT INTO tags (video_id, tag, source)
+                VALUES (?, ?, ?)
+                """, [(video_id, tag, source) for tag in tags])
                 
                 conn.commit()
                 self.logger.info(f"動画ID {video_id} にタグが追加されました")
@@ -386,19 +600,26 @@ class Database:
             self.logger.error(f"タグの追加中にエラーが発生しました: {str(e)}")
             raise
     
+    def get_video_tags(self, video_id: int) -> List[str]:
+        """動画のタグを登録順に取得"""
+        try:
+            rows = self._get_connection().execute(
+                "SELECT tag FROM tags WHERE video_id = ? ORDER BY id", (video_id,)
+            ).fetchall()
+            return [row[0] for row in rows]
+            
+        except Exception as e:
+            self.logger.error(f"タグの取得中にエラーが発生しました: {str(e)}")
+            raise
+    
     def get_video_info(self, video_id: int) -> Optional[Dict]:
         """動画情報を取得"""
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # prompt_name列の存在確認
-                has_prompt_column = True
-                try:
-                    cursor.execute("SELECT prompt_name FROM videos LIMIT 1")
-                except sqlite3.OperationalError:
-                    has_prompt_column = False
-                    self.logger.debug("videosテーブルにprompt_name列が存在しません")
+                # prompt_name列の存在確認（結果はデータベースごとにキャッシュ）
+                has_prompt_column = self._has_prompt_column(cursor)
                 
                 # prompt_name列を含めてクエリを実行
                 if has_prompt_column:
@@ -440,46 +661,53 @@ class Database:
             self.logger.error(f"動画情報の取得中にエラーが発生しました: {str(e)}")
             raise
     
-    def get_all_videos(self, page: int = 1, per_page: int = 500) -> List[Dict]:
-        """全ての動画情報をページネーション付きで取得"""
+    def get_all_videos(self, page: int = 1, per_page: int = 500, before_id: Optional[int] = None,
+                       name_filter: Optional[str] = None) -> List[Dict]:
+        """
+        全ての動画情報をページネーション付きで取得（IDの降順）
+        
+        before_idを指定した場合はOFFSETを使わず、そのIDより小さい動画からper_page件を取得する
+        （前のページの最後のIDを渡すと、読み飛ばしなしで次のページを取得できる）
+        name_filterを指定した場合は、ファイル名にその文字列を含む動画だけを取得する（英字の大文字・小文字は区別しない）
+        """
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # prompt_name列の存在確認
-                has_prompt_column = True
-                try:
-                    cursor.execute("SELECT prompt_name FROM videos LIMIT 1")
-                except sqlite3.OperationalError:
-                    has_prompt_column = False
-                    self.logger.debug("videosテーブルにprompt_name列が存在しません")
-                
-                # オフセットとリミットの計算
-                offset = (page - 1) * per_page
+                # prompt_name列の存在確認（結果はデータベースごとにキャッシュ）
+                has_prompt_column = self._has_prompt_column(cursor)
+                prompt_column = "v.prompt_name," if has_prompt_column else ""
+                
+                conditions = []
+                params = []
+                if name_filter:
+                    # フィルタの絞り込みはSQL側で行う（%と_は文字としてそのまま照合する）
+                    escaped = name_filter.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+                    conditions.append("v.file_name LIKE ? ESCAPE '\\'")
+                    params.append(f"%{escaped}%")
+                if before_id is not None:
+                    # 主キーの範囲から読み始める（OFFSET分の行を読み飛ばさない）
+                    conditions.append("v.id < ?")
+                    params.extend((before_id, per_page))
+                    limit = "LIMIT ?"
+                else:
+                    # オフセットとリミットの計算
+                    limit = "LIMIT ? OFFSET ?"
+                    params.extend((per_page, (page - 1) * per_page))
+                where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
                 
                 # タグを含めたクエリの実行（LEFT JOINとGROUP BY使用）
-                if has_prompt_column:
-                    cursor.execute("""
-                    SELECT v.id, v.file_path, v.file_name, v.status, v.progress, 
-                           v.created_at, v.updated_at, v.prompt_name,
-                           GROUP_CONCAT(t.tag) as tags
-                    FROM videos v
-                    LEFT JOIN tags t ON v.id = t.video_id
-                    GROUP BY v.id
-                    ORDER BY v.id DESC
-                    LIMIT ? OFFSET ?
-                    """, (per_page, offset))
-                else:
-                    cursor.execute("""
-                    SELECT v.id, v.file_path, v.file_name, v.status, v.progress, 
-                           v.created_at, v.updated_at,
-                           GROUP_CONCAT(t.tag) as tags
-                    FROM videos v
-                    LEFT JOIN tags t ON v.id = t.video_id
-                    GROUP BY v.id
-                    ORDER BY v.id DESC
-                    LIMIT ? OFFSET ?
-                    """, (per_page, offset))
+                cursor.execute(f"""
+                SELECT v.id, v.file_path, v.file_name, v.status, v.progress, 
+                       v.created_at, v.updated_at, {prompt_column}
+                       GROUP_CONCAT(t.tag) as tags
+                FROM videos v
+                LEFT JOIN tags t ON v.id = t.video_id
+                {where}
+                GROUP BY v.id
+                ORDER BY v.id DESC
+                {limit}
+                """, params)
                 
                 rows = cursor.fetchall()
                 videos = []
@@ -516,6 +744,32 @@ class Database:
             self.logger.error(f"全ての動画情報の取得中にエラーが発生しました: {str(e)}")
             raise
     
+    def get_all_video_ids(self) -> List[int]:
+        """全ての動画IDを取得（get_all_videosと同じIDの降順、タグは結合しない）"""
+        try:
+            rows = self._get_connection().execute("SELECT id FROM videos ORDER BY id DESC").fetchall()
+            return [row[0] for row in rows]
+            
+        except Exception as e:
+            self.logger.error(f"動画IDの一覧取得中にエラーが発生しました: {str(e)}")
+            raise
+    
+    def get_videos_signature(self) -> int:
+        """
+        データベースの変更を表す値を取得（画面更新・キャッシュの要否判定用）
+        
+        テーブルを読まずに、呼び出し元スレッドの接続で行った変更件数（total_changes）と、
+        他の接続（ワーカースレッドや別ウィンドウ）のコミットで変わるPRAGMA data_versionから計算する
+        """
+        try:
+            conn = self._get_connection()
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            return hash((self._local.conn_id, conn.total_changes, data_version))
+                
+        except Exception as e:
+            self.logger.error(f"動画一覧のシグネチャ取得中にエラーが発生しました: {str(e)}")
+            raise
+    
     def get_latest_analysis_result(self, video_id: int) -> Dict:
         """指定された動画の最新の解析結果を取得 - 改善版：構造化されたフィールドを含む"""
         try:
@@ -583,11 +837,7 @@ class Database:
                 cursor = conn.cursor()
                 
                 # プロンプト情報の列が存在しない場合は追加
-                try:
-                    cursor.execute("SELECT prompt_name FROM videos LIMIT 1")
-                except sqlite3.OperationalError:
-                    cursor.execute("ALTER TABLE videos ADD COLUMN prompt_name TEXT")
-                    self.logger.info("videosテーブルにprompt_name列を追加しました")
+                self._ensure_prompt_column(cursor)
                 
                 # プロンプト名を更新
                 cursor.execute(
@@ -607,20 +857,94 @@ class Database:
         except Exception as e:
             self.logger.error(f"プロンプト設定の更新中にエラーが発生しました: {str(e)}")
             return False
+    
+    def update_videos_prompt(self, video_ids: List[int], prompt_name: str) -> bool:
+        """
+        複数のビデオのプロンプト名を1つのトランザクションで更新
+        
+        Args:
+            video_ids: 対象ビデオのIDのリスト
+            prompt_name: プロンプト名
+            
+        Returns:
+            bool: 成功した場合はTrue、失敗した場合はFalse
+        """
+        if not video_ids:
+            return True
+        
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                
+                # プロンプト情報の列が存在しない場合は追加
+                self._ensure_prompt_column(cursor)
+                
+                cursor.executemany(
+                    "UPDATE videos SET prompt_name = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                    [(prompt_name, video_id) for video_id in video_ids]
+                )
+                
+                conn.commit()
+                self.logger.debug(f"{len(video_ids)}件のビデオのプロンプト設定を更新しました: {prompt_name}")
+                return True
+                    
+        except Exception as e:
+            self.logger.error(f"プロンプト設定の一括更新中にエラーが発生しました: {str(e)}")
+            return False
+    
+    def get_videos_by_ids(self, video_ids: List[int]) -> Dict[int, Dict]:
+        """
+        複数の動画のパスと状態をまとめて取得
+        
+        Args:
+            video_ids: 対象ビデオのIDのリスト
+            
+        Returns:
+            Dict[int, Dict]: video_id -> {"file_path", "status"}（存在しないIDは含まれない）
+        """
+        videos = {}
+        if not video_ids:
+            return videos
+        
+        try:
+            cursor = self._get_connection().cursor()
+            for chunk in self._chunks(video_ids):
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT id, file_path, status FROM videos WHERE id IN ({placeholders})",
+                    chunk
+                )
+                for video_id, file_path, status in cursor.fetchall():
+                    videos[video_id] = {"file_path": file_path, "status": status}
+            return videos
+            
+        except Exception as e:
+            self.logger.error(f"動画情報の一括取得中にエラーが発生しました: {str(e)}")
+            raise
 
     def delete_video(self, video_id: int):
         """指定された動画と関連データをデータベースから削除"""
+        self.delete_videos([video_id])
+    
+    def delete_videos(self, video_ids: List[int]):
+        """複数の動画と関連データを1つのトランザクションで削除"""
+        if not video_ids:
+            return
+        
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
-                # 解析結果を削除
-                cursor.execute("DELETE FROM analysis_results WHERE video_id = ?", (video_id,))
-                # タグを削除
-                cursor.execute("DELETE FROM tags WHERE video_id = ?", (video_id,))
-                # 動画を削除
-                cursor.execute("DELETE FROM videos WHERE id = ?", (video_id,))
+                paths = []
+                for chunk in self._chunks(list(video_ids)):
+                    placeholders = ",".join("?" * len(chunk))
+                    # 登録済みパスの集合から外すため、削除前にパスを取得
+                    cursor.execute(f"SELECT file_path FROM videos WHERE id IN ({placeholders})", chunk)
+                    paths.extend(row[0] for row in cursor.fetchall())
+                    # 動画を削除（解析結果・タグはトリガーで削除される）
+                    cursor.execute(f"DELETE FROM videos WHERE id IN ({placeholders})", chunk)
                 conn.commit()
-                self.logger.info(f"動画ID {video_id} を削除しました")
+                self._known_paths.difference_update(paths)
+                self.logger.info(f"動画ID {video_ids} を削除しました")
         except Exception as e:
             self.logger.error(f"動画削除中にエラーが発生しました: {str(e)}")
             raise 
\ No newline at end of file
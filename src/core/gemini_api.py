@@ -243,7 +243,8 @@ class GeminiAPI:
         """動画を解析して結果を返す - 改善版：より柔軟なレスポンス処理"""
         try:
             # プロンプト設定の読み込み
-            self.prompt_manager.load_config(config_name)
+            # 複数の動画を並行して解析するため、共有のcurrent_configではなく読み込んだ設定をそのまま使う
+            prompt_config = self.prompt_manager.load_config(config_name)
 
             # 動画のアップロード
             video_file = self.upload_video(video_path)
@@ -252,7 +253,7 @@ class GeminiAPI:
             self.wait_for_processing(video_file)
 
             # プロンプトの生成
-            prompt = self.prompt_manager.generate_prompt(video_path)
+            prompt = self.prompt_manager.generate_prompt(video_path, prompt_config)
             if not prompt:
                 raise ValueError("プロンプトの生成に失敗しました")
 
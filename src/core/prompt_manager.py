@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 import json
 import logging
@@ -10,6 +11,9 @@ class PromptManager:
         self.logger = logging.getLogger(__name__)
         self.config_dir = config_dir
         self.current_config: Optional[Dict] = None
+        # 設定ファイル一覧のキャッシュ（ディレクトリの更新時刻で無効化）
+        self._configs_cache: List[str] = []
+        self._configs_mtime: Optional[float] = None
         
         # 設定ディレクトリが存在しない場合は作成
         if not self.config_dir.exists():
@@ -18,7 +22,14 @@ class PromptManager:
     def get_available_configs(self) -> List[str]:
         """利用可能な設定ファイルの一覧を取得"""
         try:
-            return [f.stem for f in self.config_dir.glob("*.json")]
+            # ディレクトリに変更がなければキャッシュを返す
+            mtime = os.stat(self.config_dir).st_mtime
+            if mtime == self._configs_mtime:
+                return list(self._configs_cache)
+            
+            self._configs_cache = [f.stem for f in self.config_dir.glob("*.json")]
+            self._configs_mtime = mtime
+            return list(self._configs_cache)
         except Exception as e:
             self.logger.error(f"設定ファイルの一覧取得に失敗: {str(e)}")
             return []
@@ -47,8 +58,7 @@ class PromptManager:
                     self.logger.error(f"設定ファイルが見つかりません: {config_name}")
                     return self.load_config("default")
             
-            with open(config_path, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            config = json.loads(config_path.read_bytes())
             
             if self._validate_config(config):
                 self.current_config = config
@@ -88,19 +98,22 @@ class PromptManager:
     
     def get_current_config(self) -> Dict:
         """現在読み込まれている設定を取得"""
-        return self.current_config or self.load_config("default")
+        return self.current_config if self.current_config is not None else self.load_config("default")
     
-    def generate_prompt(self, video_path: str) -> str:
-        """プロンプトを生成"""
-        config = self.get_current_config()
+    def generate_prompt(self, video_path: str, config: Optional[Dict] = None) -> str:
+        """
+        プロンプトを生成
+        
+        configを渡した場合は現在の設定ではなくそれを使う（複数の解析が並行して別々の設定を使う場合）
+        """
+        if config is None:
+            config = self.get_current_config()
         if not config:
             self.logger.error("設定が読み込まれていません")
             return ""
         
-        # ファイル名を抽出
-        video_file = Path(video_path)
-        file_name = video_file.name  # 拡張子付きファイル名
-        file_stem = video_file.stem  # 拡張子なしファイル名
+        # ファイル名を抽出（拡張子なし）
+        file_stem = os.path.splitext(os.path.basename(video_path))[0]
         
         # プロンプトのベース部分
         prompt = f"この動画（ファイル名: {file_stem}）の動作を解析して、以下の情報を含むJSONで返してください：\n"
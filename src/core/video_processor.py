@@ -1,3 +1,4 @@
+import os
 import logging
 import asyncio
 from typing import List, Optional, Callable
@@ -20,13 +21,40 @@ class VideoProcessor:
         else:
             self.db = database
         self.gemini = GeminiAPI()
-        self.executor = ThreadPoolExecutor(
-            max_workers=1  # 同時処理数を1に制限
-        )
+        # 同時に解析する動画数（設定のperformance.max_parallel_videos、未設定ならCPUコア数の半分、最低2）
+        self.max_workers = self._get_max_parallel_videos()
+        self.executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        # 空きがない間は待機させる（ポーリングせずに順番待ち）
+        self._slots = asyncio.Semaphore(self.max_workers)
         self._processing = set()  # 処理中の動画ID
+        self._waiting = set()  # 空き待ちの動画ID
         self._cancel_requested = set()  # キャンセルが要求された動画ID
         self.current_prompt_config = "default"  # 現在のプロンプト設定
     
+    def _get_max_parallel_videos(self) -> int:
+        """同時に解析する動画数を設定から取得"""
+        default = max(2, (os.cpu_count() or 2) // 2)
+        value = self.config.get_performance_config().get("max_parallel_videos")
+        if value is None:
+            return default
+        try:
+            value = int(value)
+            if value < 1:
+                raise ValueError("1以上を指定してください")
+            return value
+        except (TypeError, ValueError) as e:
+            self.logger.warning(f"max_parallel_videosの設定が不正なため{default}を使用します: {value} - {str(e)}")
+            return default
+    
+    def set_database(self, database: Database):
+        """
+        使用するデータベースを差し替える
+        
+        スレッドプール・APIクライアント・プロンプト設定はそのまま引き継ぐ
+        """
+        self.logger.info(f"データベースを変更: {database.get_database_path()}")
+        self.db = database
+    
     def set_prompt_config(self, config_name: str):
         """プロンプト設定を変更"""
         self.logger.info(f"プロンプト設定を変更: {config_name}")
@@ -35,45 +63,47 @@ class VideoProcessor:
     async def process_video(self, video_path: str, progress_callback: Optional[Callable] = None, status_callback: Optional[Callable] = None) -> bool:
         """動画を非同期で処理"""
         try:
-            print(f"動画処理が開始されました - file_path: {video_path}")
             self.logger.info(f"動画処理が開始されました - file_path: {video_path}")
             
             # データベースに動画を追加
             video_id = self.db.add_video(video_path)
-            print(f"データベースに動画が追加されました - video_id: {video_id}")
+            self.logger.debug(f"データベースに動画が追加されました - video_id: {video_id}")
             
-            # 既に処理中の場合は待機
-            if video_id in self._processing:
+            # 既に処理中・待機中の場合は何もしない
+            if video_id in self._processing or video_id in self._waiting:
                 self.logger.debug(f"この動画は既に処理中です - video_id: {video_id}")
                 return False
                 
-            # 他の動画の処理完了を待機
-            if len(self._processing) > 0:
+            # 空きがなければ待機（待機開始時に一度だけステータス更新）
+            if self._slots.locked():
                 self.logger.info(f"他の動画の処理完了を待機中 - 待機中の動画ID: {video_id}")
-                # 待機開始時に一度だけステータス更新
                 self.db.update_video_status(video_id, VideoStatus.PENDING.value)
                 if status_callback:
                     status_callback(video_id, VideoStatus.PENDING.value)
-                
-                # 待機ループ（ステータス更新なし）
-                while len(self._processing) > 0:
-                    await asyncio.sleep(5)  # 待機間隔を5秒に延長
             
-            print(f"処理を開始します - video_id: {video_id}")
+            self._waiting.add(video_id)
+            try:
+                await self._slots.acquire()
+            finally:
+                self._waiting.discard(video_id)
+            
+            self.logger.debug(f"処理を開始します - video_id: {video_id}")
             self._processing.add(video_id)
-            print(f"処理中リストに追加されました - 現在の処理中: {self._processing}")
-            self.db.update_video_status(video_id, VideoStatus.PROCESSING.value, 0)
-            if status_callback:
-                status_callback(video_id, VideoStatus.PROCESSING.value)
-            if progress_callback:
-                progress_callback(video_id, 0)
             
             try:
+                self.db.update_video_status(video_id, VideoStatus.PROCESSING.value, 0)
+                if status_callback:
+                    status_callback(video_id, VideoStatus.PROCESSING.value)
+                if progress_callback:
+                    progress_callback(video_id, 0)
+                
                 # 動画の解析（スレッドプールで実行）
-                loop = asyncio.get_event_loop()
+                loop = asyncio.get_running_loop()
                 result = await loop.run_in_executor(
                     self.executor,
-                    lambda: self.gemini.analyze_video(video_path, self.current_prompt_config)
+                    self.gemini.analyze_video,
+                    video_path,
+                    self.current_prompt_config
                 )
                 
                 # キャンセルされた場合
@@ -128,18 +158,22 @@ class VideoProcessor:
                 
             finally:
                 self._processing.remove(video_id)
+                self._slots.release()
                 
         except Exception as e:
             self.logger.error(f"動画の処理中にエラーが発生しました: {str(e)}")
             return False
     
     async def process_multiple_videos(self, video_paths: List[str], progress_callback: Optional[Callable] = None, status_callback: Optional[Callable] = None):
-        """複数の動画を順次処理"""
-        results = []
-        for path in video_paths:
-            result = await self.process_video(path, progress_callback, status_callback)
-            results.append(result)
-        return results
+        """
+        複数の動画をまとめて処理
+        
+        同時に解析する数はprocess_video内のセマフォ（max_workers）で制限されるため、ここでは全件を一度に投入する
+        空きを待つ動画はセマフォの待機中にPENDINGとして表示される
+        """
+        return list(await asyncio.gather(
+            *(self.process_video(path, progress_callback, status_callback) for path in video_paths)
+        ))
     
     def cancel_processing(self, video_id: int):
         """動画処理のキャンセルを要求"""
@@ -147,6 +181,15 @@ class VideoProcessor:
             self._cancel_requested.add(video_id)
             self.logger.info(f"動画ID {video_id} の処理キャンセルが要求されました")
     
+    def shutdown(self):
+        """
+        アプリケーション終了時にスレッドプールを停止する
+        
+        まだ開始していない解析はキャンセルし、実行中の解析の完了は待たない
+        """
+        self.logger.info("動画処理のスレッドプールを停止します")
+        self.executor.shutdown(wait=False, cancel_futures=True)
+    
     def is_processing(self, video_id: int) -> bool:
         """動画が処理中かどうかを確認"""
         return video_id in self._processing 
\ No newline at end of file
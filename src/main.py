@@ -1,5 +1,6 @@
 import sys
 import os
+import asyncio
 import logging
 from pathlib import Path
 
@@ -7,6 +8,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
+import qasync
 from PySide6.QtWidgets import QApplication
 from src.ui.main_window import MainWindow
 from src.core.config_manager import ConfigManager
@@ -36,12 +38,18 @@ def main():
         # アプリケーションの作成
         app = QApplication(sys.argv)
         
+        # Qtのイベントループ上でasyncioを動かす
+        loop = qasync.QEventLoop(app)
+        asyncio.set_event_loop(loop)
+        
         # メインウィンドウの作成
         window = MainWindow()
         window.show()
         
         # アプリケーションの実行
-        sys.exit(app.exec())
+        with loop:
+            exit_code = loop.run_forever()
+        sys.exit(exit_code)
         
     except Exception as e:
         logger.error(f"アプリケーション起動中にエラーが発生しました: {str(e)}", exc_info=True)
@@ -1,26 +1,73 @@
 import os
 import logging
 import asyncio
-import threading
 from pathlib import Path
 from PySide6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QCheckBox, QTableWidget, QTableWidgetItem,
-    QLabel, QProgressBar, QFileDialog, QMessageBox,
+    QPushButton, QCheckBox, QTableView,
+    QLabel, QFileDialog, QMessageBox,
     QMenuBar, QMenu, QInputDialog, QDialog, QLineEdit, QDialogButtonBox,
-    QComboBox, QAbstractItemView
+    QComboBox, QAbstractItemView, QApplication, QHeaderView
 )
-from PySide6.QtCore import Qt, QMimeData, Signal, QObject, QTimer
-from PySide6.QtGui import QDragEnterEvent, QDropEvent, QAction
+from PySide6.QtCore import Qt, QMimeData, Signal, QTimer, QFileSystemWatcher, QUrl
+from PySide6.QtGui import QDragEnterEvent, QDropEvent, QAction, QDesktopServices
 from src.core.config_manager import ConfigManager
 from src.core.video_processor import VideoProcessor
 from src.core.database import Database
 from src.core.export_manager import ExportManager
 from src.core.prompt_manager import PromptManager
 from src.core.constants import VideoStatus  # VideoStatusをインポート
-from typing import List
+from src.ui.video_table_model import VideoTableModel, COL_OPEN, COL_PROGRESS, COL_ACTIONS
+from src.ui.video_table_delegates import ProgressBarDelegate, ButtonDelegate
+from typing import List, Dict, Optional, Set, Tuple
 from src_list.ui.main_window import MainWindow as MotionListWindow
 
+# 1回で読み込む動画の件数（ページはワーカースレッドで取得する）
+VIDEO_PAGE_SIZE = 200
+
+# フィルタ入力が止まってから適用するまでの待ち時間（ミリ秒）
+FILTER_DEBOUNCE_MS = 200
+
+# 読み込んだ動画一覧のページを保持する数（フィルタを打ち直した時などに再問い合わせしない）
+VIDEO_PAGE_CACHE_SIZE = 20
+
+# ドラッグ＆ドロップエリアとファイル選択ボタンのスタイル（ウィンドウ生成のたびに文字列を組み立てない）
+DROP_AREA_STYLE = """
+    QLabel {
+        border: 2px dashed #4a90e2;
+        border-radius: 8px;
+        padding: 30px;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                  stop:0 #ffffff, stop:1 #f5f8fa);
+        color: #1e3a5f;
+        font-size: 14px;
+        font-weight: bold;
+    }
+    QLabel:hover {
+        border-color: #2980b9;
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                                  stop:0 #f5f8fa, stop:1 #e8f1f8);
+        color: #0d2b4d;
+    }
+"""
+
+SELECT_BUTTON_STYLE = """
+    QPushButton {
+        background: #4a90e2;
+        color: white;
+        border: none;
+        padding: 8px 15px;
+        border-radius: 4px;
+        font-weight: 500;
+    }
+    QPushButton:hover {
+        background: #357abd;
+    }
+    QPushButton:pressed {
+        background: #2980b9;
+    }
+"""
+
 class AutoCloseMessageBox(QWidget):
     """自動で消える非モーダルメッセージボックス"""
     def __init__(self, title: str, message: str, auto_close_time: int = 2000, parent=None):
@@ -55,21 +102,17 @@ class AutoCloseMessageBox(QWidget):
         # 表示
         self.show()
 
-class SignalEmitter(QObject):
-    """非同期処理からのシグナルを発行するためのクラス"""
-    progress_updated = Signal(int, int)  # video_id, progress
-    status_updated = Signal(int, str)    # video_id, status
-    error_occurred = Signal(str)         # error_message
-    database_changed = Signal()          # データベース変更シグナル（新規追加）
-
 class MainWindow(QMainWindow):
+    # 非同期処理・メニュー操作から発行するシグナル
+    error_occurred = Signal(str)         # error_message
+    database_changed = Signal()          # データベース変更シグナル
+    
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(__name__)
         self.config = ConfigManager()
         
         # データの初期化
-        self.signal_emitter = SignalEmitter()
         self.db = Database(self.config.get_active_database())
         self.logger.info(f"データベースを初期化しました: {self.db.get_database_path()}")
         
@@ -80,10 +123,28 @@ class MainWindow(QMainWindow):
         self.prompt_manager = PromptManager()
         self.current_filter = ""  # フィルタ文字列を保持
         
-        self.signal_emitter.progress_updated.connect(self.update_progress)
-        self.signal_emitter.status_updated.connect(self.update_status)
-        self.signal_emitter.error_occurred.connect(self.show_error)
-        self.signal_emitter.database_changed.connect(self.refresh_after_db_change)
+        self._last_table_sig: Optional[int] = None  # 最後に読み込んだ時点のDBのシグネチャ
+        self._load_generation = 0  # 一覧を読み込み直すたびに増やし、それ以前に始めた再読込の結果を捨てる
+        # (DBのパス, フィルタ, before_id) -> ページ。DBのシグネチャが変わったら破棄する
+        self._page_cache: Dict[Tuple[str, str, Optional[int]], List[Dict]] = {}
+        self._page_cache_sig: Optional[int] = None
+        
+        # 進捗・状態の更新はまとめて約30Hzで画面に反映する
+        self._pending_progress: Dict[int, int] = {}
+        self._pending_status: Dict[int, str] = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(33)
+        self._flush_timer.timeout.connect(self._flush_pending)
+        
+        # DB切り替えが短時間に続いた場合は、最後の1回だけ画面を更新する
+        self._db_change_timer = QTimer(self)
+        self._db_change_timer.setSingleShot(True)
+        self._db_change_timer.setInterval(50)
+        self._db_change_timer.timeout.connect(self.refresh_after_db_change)
+        
+        self.error_occurred.connect(self.show_error)
+        self.database_changed.connect(self._db_change_timer.start, Qt.QueuedConnection)
         
         self.update_window_title()
         
@@ -105,36 +166,53 @@ class MainWindow(QMainWindow):
         
         self.setAcceptDrops(True)
         
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        
-        self.loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
-        self.loop_thread.start()
-        
+        # 全件は読み込まず、表示に必要な分だけページ単位で読み込む
         self.load_initial_data()
         
         self.logger.info("メインウィンドウの初期化が完了しました")
     
-    def _run_event_loop(self):
-        """イベントループを実行"""
-        asyncio.set_event_loop(self.loop)
-        self.loop.run_forever()
-    
     def load_initial_data(self):
-        """初期データの読み込み"""
+        """
+        動画一覧の読み込みを開始
+        
+        起動時とデータベース切り替え時に使う。全件は読み込まず、ビューが末尾付近まで
+        スクロールされた時にモデルのfetchMore()から次のページを取得する
+        """
+        self._last_table_sig = self.db.get_videos_signature()
+        self._load_generation += 1
+        self.video_model.set_page_source(self._fetch_video_page, VIDEO_PAGE_SIZE)
+    
+    async def _fetch_video_page(self, before_id: Optional[int]) -> List[Dict]:
+        """
+        before_idより古い動画を1ページ分取得（失敗時は空のリストを返し、以降の読み込みを止める）
+        
+        フィルタ中はファイル名が一致する動画だけをSQLで絞り込んで取得する。
+        問い合わせはワーカースレッドで行い、その間もUIは操作できる
+        """
         try:
-            videos = self.db.get_all_videos()
-            for video in videos:
-                self.add_video_to_table(
-                    video["file_path"],
-                    video["id"],
-                    video["status"],
-                    video["progress"],
-                    video["tags"]  # タグ情報を追加
+            # 前回の問い合わせ以降にDBが変更されていなければ、同じ条件のページは読み直さない
+            sig = self.db.get_videos_signature()
+            if sig != self._page_cache_sig:
+                self._page_cache.clear()
+                self._page_cache_sig = sig
+            name_filter = self.current_filter
+            key = (self.db.get_database_path(), name_filter, before_id)
+            videos = self._page_cache.get(key)
+            if videos is None:
+                # 前のページの最後のIDから続けて読む（OFFSETで読み飛ばさない）
+                videos = await asyncio.to_thread(
+                    self.db.get_all_videos, per_page=VIDEO_PAGE_SIZE, before_id=before_id,
+                    name_filter=name_filter or None
                 )
+                if len(self._page_cache) >= VIDEO_PAGE_CACHE_SIZE:
+                    # 最も古く保持したページから捨てる
+                    del self._page_cache[next(iter(self._page_cache))]
+                self._page_cache[key] = videos
+            return videos
         except Exception as e:
-            self.logger.error(f"初期データの読み込み中にエラーが発生しました: {str(e)}")
+            self.logger.error(f"動画一覧の読み込み中にエラーが発生しました: {str(e)}")
             self.show_error("データの読み込みに失敗しました")
+            return []
     
     def setup_prompt_selector(self, layout):
         """プロンプト設定選択用のコンボボックスを設定"""
@@ -148,6 +226,10 @@ class MainWindow(QMainWindow):
         self.prompt_combo.currentTextChanged.connect(self.on_prompt_changed)
         prompt_layout.addWidget(self.prompt_combo)
         
+        # プロンプトディレクトリの変更時のみ一覧を再読み込み
+        self._prompt_watcher = QFileSystemWatcher([str(self.prompt_manager.config_dir)], self)
+        self._prompt_watcher.directoryChanged.connect(self.on_prompt_dir_changed)
+        
         refresh_button = QPushButton("Refresh")
         refresh_button.clicked.connect(self.update_prompt_list)
         prompt_layout.addWidget(refresh_button)
@@ -160,12 +242,22 @@ class MainWindow(QMainWindow):
         
         layout.addLayout(prompt_layout)
     
+    def on_prompt_dir_changed(self, path: str):
+        """プロンプトディレクトリが変更された時の処理"""
+        self.logger.debug(f"プロンプトディレクトリの変更を検出: {path}")
+        self.update_prompt_list()
+    
     def update_prompt_list(self):
         """プロンプト設定の一覧を更新"""
+        configs = self.prompt_manager.get_available_configs()
+        
+        # 一覧に変化がなければコンボボックスを作り直さない
+        if configs == [self.prompt_combo.itemText(i) for i in range(self.prompt_combo.count())]:
+            return
+        
         current = self.prompt_combo.currentText()
         self.prompt_combo.clear()
         
-        configs = self.prompt_manager.get_available_configs()
         self.logger.info(f"利用可能なプロンプト設定: {configs}")
         self.prompt_combo.addItems(configs)
         
@@ -199,7 +291,7 @@ class MainWindow(QMainWindow):
             config_path = self.prompt_manager.get_config_path(config_name)
             if config_path and config_path.exists():
                 self.logger.info(f"プロンプト設定ファイルを開きます: {config_path}")
-                os.startfile(config_path)
+                QDesktopServices.openUrl(QUrl.fromLocalFile(str(config_path)))
             else:
                 self.logger.error(f"プロンプト設定ファイルが見つかりません: {config_name}")
                 self.show_error(f"設定ファイルが見つかりません:\n{config_path}")
@@ -211,44 +303,12 @@ class MainWindow(QMainWindow):
         """ドラッグ＆ドロップエリアの設定"""
         drop_area = QLabel("Drop Video Files Here")
         drop_area.setAlignment(Qt.AlignCenter)
-        drop_area.setStyleSheet("""
-            QLabel {
-                border: 2px dashed #4a90e2;
-                border-radius: 8px;
-                padding: 30px;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                          stop:0 #ffffff, stop:1 #f5f8fa);
-                color: #1e3a5f;
-                font-size: 14px;
-                font-weight: bold;
-            }
-            QLabel:hover {
-                border-color: #2980b9;
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                                          stop:0 #f5f8fa, stop:1 #e8f1f8);
-                color: #0d2b4d;
-            }
-        """)
+        drop_area.setStyleSheet(DROP_AREA_STYLE)
         drop_area.setMinimumHeight(120)
         
         # ファイル選択ボタンのスタイルも更新
         select_button = QPushButton("Choose Files...")
-        select_button.setStyleSheet("""
-            QPushButton {
-                background: #4a90e2;
-                color: white;
-                border: none;
-                padding: 8px 15px;
-                border-radius: 4px;
-                font-weight: 500;
-            }
-            QPushButton:hover {
-                background: #357abd;
-            }
-            QPushButton:pressed {
-                background: #2980b9;
-            }
-        """)
+        select_button.setStyleSheet(SELECT_BUTTON_STYLE)
         select_button.clicked.connect(self.on_select_files)
         
         parent_layout.addWidget(drop_area)
@@ -268,6 +328,12 @@ class MainWindow(QMainWindow):
         self.filter_input.textChanged.connect(self.apply_filter)
         filter_layout.addWidget(self.filter_input)
         
+        # 入力中はフィルタ適用を遅延させ、最後の入力だけを反映する
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(FILTER_DEBOUNCE_MS)
+        self._filter_timer.timeout.connect(self._apply_filter_now)
+        
         # クリアボタン
         clear_button = QPushButton("Clear")
         clear_button.clicked.connect(self.clear_filter)
@@ -277,15 +343,33 @@ class MainWindow(QMainWindow):
         layout.addLayout(filter_layout)
 
     def apply_filter(self):
-        """フィルタを適用"""
-        self.current_filter = self.filter_input.text().lower()
-        self.refresh_table()
+        """フィルタを適用（入力が落ち着くまで遅延）"""
+        self._filter_timer.start()
+
+    def _apply_filter_now(self):
+        """
+        フィルタを適用
+        
+        一致する動画の絞り込みはSQLで行い、一覧はページ単位の読み込みからやり直す
+        （全件を読み込んでから行を非表示にすることはしない）
+        """
+        new_filter = self.filter_input.text().lower()
+        # 入力して元に戻した場合など、フィルタ文字列が変わっていなければ何もしない
+        if new_filter == self.current_filter:
+            return
+        self.current_filter = new_filter
+        self.load_initial_data()
+    
+    def _matches_filter(self, video: Dict) -> bool:
+        """動画のファイル名が現在のフィルタに一致するか"""
+        name = video.get("file_name") or os.path.basename(video["file_path"])
+        return self.current_filter in name.lower()
 
     def clear_filter(self):
         """フィルタをクリア"""
         self.filter_input.clear()
-        self.current_filter = ""
-        self.refresh_table()
+        self._filter_timer.stop()
+        self._apply_filter_now()
 
     def setup_auto_process_switch(self, parent_layout):
         """自動処理スイッチの設定"""
@@ -295,18 +379,32 @@ class MainWindow(QMainWindow):
     
     def setup_table_view(self, parent_layout):
         """テーブルビューの設定"""
-        self.table = QTableWidget()
+        self.video_model = VideoTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.video_model)
         # 行選択と複数選択を有効化
         self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
         self.table.setSelectionMode(QAbstractItemView.MultiSelection)
         # コンテキストメニューを有効化
         self.table.setContextMenuPolicy(Qt.CustomContextMenu)
         self.table.customContextMenuRequested.connect(self.open_table_context_menu)
-        self.table.setColumnCount(6)  # カラム数を6に変更
-        self.table.setHorizontalHeaderLabels([
-            "Video Name", "Open", "Status", "Progress", "Tags", "Actions"  # "Open"カラムを追加
-        ])
+        
+        # 進捗バーとボタンはセルごとのウィジェットを作らず、デリゲートで描画する
+        self.table.setItemDelegateForColumn(COL_PROGRESS, ProgressBarDelegate(self.table))
+        open_delegate = ButtonDelegate(self.table)
+        open_delegate.clicked.connect(self._open_row_video)
+        self.table.setItemDelegateForColumn(COL_OPEN, open_delegate)
+        run_delegate = ButtonDelegate(self.table)
+        run_delegate.clicked.connect(self._reprocess_from_button)
+        self.table.setItemDelegateForColumn(COL_ACTIONS, run_delegate)
+        
         self.table.horizontalHeader().setStretchLastSection(True)
+        # 行の高さは固定にし、セルの文字列は折り返さない（描画時に行ごとの高さ計算や折り返し計算をしない）
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table.setWordWrap(False)
+        # 行番号とモデルの行を一致させるため、ビュー側での並べ替えは行わない
+        # （一括更新のたびに並べ替えが走ることもない）
+        self.table.setSortingEnabled(False)
         parent_layout.addWidget(self.table)
     
     def setup_batch_operations(self, parent_layout):
@@ -331,9 +429,9 @@ class MainWindow(QMainWindow):
         
         # CSVセクション
         csv_layout = QHBoxLayout()
-        export_csv_btn = QPushButton("Export CSV")
-        export_csv_btn.clicked.connect(self.export_to_csv)
-        csv_layout.addWidget(export_csv_btn)
+        self.export_csv_btn = QPushButton("Export CSV")
+        self.export_csv_btn.clicked.connect(self.export_to_csv)
+        csv_layout.addWidget(self.export_csv_btn)
         
         open_csv_folder_btn = QPushButton("📁CSV")
         open_csv_folder_btn.clicked.connect(lambda: self.open_folder("csv"))
@@ -343,9 +441,9 @@ class MainWindow(QMainWindow):
         
         # JSONセクション
         json_layout = QHBoxLayout()
-        export_json_btn = QPushButton("Export JSON")
-        export_json_btn.clicked.connect(self.export_to_json)
-        json_layout.addWidget(export_json_btn)
+        self.export_json_btn = QPushButton("Export JSON")
+        self.export_json_btn.clicked.connect(self.export_to_json)
+        json_layout.addWidget(self.export_json_btn)
         
         open_json_folder_btn = QPushButton("📁JSON")
         open_json_folder_btn.clicked.connect(lambda: self.open_folder("json"))
@@ -378,102 +476,119 @@ class MainWindow(QMainWindow):
     
     def process_dropped_files(self, files):
         """ドロップされたファイルの処理"""
+        # 同じドロップ内での重複を除外（順序は維持）
+        files = list(dict.fromkeys(files))
         for file in files:
             self.logger.info(f"ファイルが追加されました: {file}")
-            
-            # 重複チェックを追加
-            try:
-                conn = self.db._get_connection()
-                cursor = conn.cursor()
-                cursor.execute("SELECT id FROM videos WHERE file_path = ?", (file,))
-                existing = cursor.fetchone()
-                conn.close()
-                if existing:
-                    video_id = existing[0]
-                    self.logger.info(f"重複ファイル検出: {file} (video_id={video_id})")
-                    # 自動で消える通知を表示（非モーダル）
-                    AutoCloseMessageBox("重複ファイル", f"ファイル '{Path(file).name}' は既に追加されています。重複をスキップします。", 1500, self)
-                    continue
-            except Exception as e:
-                self.logger.error(f"重複チェック中にエラーが発生しました: {str(e)}", exc_info=True)
-
-            # データベースに追加
-            try:
-                video_id = self.db.add_video(file)
-                self.add_video_to_table(file, video_id, "UNPROCESSED", 0, [])  # 空のタグリストを追加
-                
-                # 自動処理が有効な場合は処理を開始
-                if self.auto_process.isChecked():
-                    asyncio.run_coroutine_threadsafe(
-                        self.process_video(video_id, file),
-                        self.loop
-                    )
-                    
-            except Exception as e:
-                self.logger.error(f"ファイルの追加中にエラーが発生しました: {str(e)}")
-                self.show_error(f"ファイルの追加に失敗しました: {file}")
+        
+        # 重複チェック（DBが保持する登録済みパスの集合とメモリ上で照合）
+        duplicates = []
+        new_files = []
+        for file in files:
+            (duplicates if self.db.is_known_path(file) else new_files).append(file)
+        
+        if duplicates:
+            self._notify_duplicates(duplicates)
+        
+        if not new_files:
+            return
+        
+        # データベースに一括追加
+        try:
+            video_ids = self.db.add_videos_bulk(new_files)
+        except Exception as e:
+            self.logger.error(f"ファイルの追加中にエラーが発生しました: {str(e)}")
+            self.show_error(f"ファイルの追加に失敗しました: {len(new_files)}件")
+            return
+        
+        self._append_rows([
+            {"id": video_id, "file_path": file, "status": VideoStatus.get_default(), "progress": 0, "tags": []}
+            for file, video_id in zip(new_files, video_ids)
+        ])
+        
+        # 自動処理が有効な場合は処理を開始
+        if self.auto_process.isChecked():
+            self._start_processing(new_files)
     
-    def add_video_to_table(self, file_path: str, video_id: int, status: str, progress: int, tags: list = None):
-        """テーブルに新しいファイルを追加"""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        
-        # ファイル名
-        self.table.setItem(row, 0, QTableWidgetItem(Path(file_path).name))
-        self.table.item(row, 0).setData(Qt.UserRole, video_id)
-        
-        # 動画を開くボタン
-        open_button = QPushButton("🎬")
-        open_button.setToolTip("Open Video")
-        open_button.clicked.connect(lambda: os.startfile(file_path))
-        self.table.setCellWidget(row, 1, open_button)
-        
-        # 状態
-        self.table.setItem(row, 2, QTableWidgetItem(status))
-        
-        # 進捗バー
-        progress_bar = QProgressBar()
-        progress_bar.setValue(progress)
-        self.table.setCellWidget(row, 3, progress_bar)
-        
-        # タグの表示
-        tag_text = ", ".join(tags) if tags else ""
-        self.table.setItem(row, 4, QTableWidgetItem(tag_text))
-        
-        # 再処理ボタン
-        reprocess_button = QPushButton("▶Run")
-        reprocess_button.clicked.connect(lambda: self.on_reprocess(video_id, file_path))
-        self.table.setCellWidget(row, 5, reprocess_button)
+    def _start_processing(self, file_paths: List[str]):
+        """
+        複数の動画の解析をまとめて開始
+        
+        動画ごとにタスクを作らず、1つのタスクに渡す（同時に解析する数はVideoProcessor側で制限される）
+        """
+        asyncio.ensure_future(
+            self.processor.process_multiple_videos(
+                file_paths,
+                self.update_progress,
+                self.update_status
+            )
+        )
+    
+    def _notify_duplicates(self, duplicates: List[str]):
+        """重複ファイルをログに残し、まとめて1回だけ通知"""
+        for file in duplicates:
+            self.logger.info(f"重複ファイル検出: {file}")
+        # 自動で消える通知を表示（非モーダル、まとめて1回）
+        names = "\n".join(Path(file).name for file in duplicates)
+        AutoCloseMessageBox("重複ファイル", f"以下のファイルは既に追加されています。重複をスキップします。\n{names}", 1500, self)
+    
+    def _append_rows(self, videos: List[Dict]):
+        """末尾に複数行を一括追加（既にある動画と、フィルタ中は一致しない動画は追加しない）"""
+        if self.current_filter:
+            videos = [video for video in videos if self._matches_filter(video)]
+        self.video_model.append_videos(videos)
+    
+    def _open_row_video(self, row: int):
+        """行の「動画を開く」ボタンから動画ファイルを開く"""
+        QDesktopServices.openUrl(QUrl.fromLocalFile(self.video_model.file_path_at(row)))
+    
+    def _reprocess_from_button(self, row: int):
+        """行の再処理ボタンから対象の動画を再処理"""
+        self.on_reprocess(self.video_model.video_id_at(row), self.video_model.file_path_at(row))
     
     async def process_video(self, video_id: int, file_path: str):
         """動画を非同期で処理"""
         try:
+            # イベントループはUIスレッド上で動くため、コールバックは直接呼び出す
             await self.processor.process_video(
                 file_path,
-                lambda vid, prog: self.signal_emitter.progress_updated.emit(vid, prog),
-                lambda vid, status: self.signal_emitter.status_updated.emit(vid, status)
+                self.update_progress,
+                self.update_status
             )
         except Exception as e:
             self.logger.error(f"動画の処理中にエラーが発生しました: {str(e)}")
-            self.signal_emitter.error_occurred.emit(f"動画の処理に失敗しました: {file_path}")
+            self.error_occurred.emit(f"動画の処理に失敗しました: {file_path}")
     
     def update_progress(self, video_id: int, progress: int):
-        """進捗バーの更新"""
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.data(Qt.UserRole) == video_id:
-                progress_bar = self.table.cellWidget(row, 3)
-                if progress_bar:
-                    progress_bar.setValue(progress)
-                break
+        """進捗バーの更新（次回のフラッシュでまとめて反映）"""
+        self._pending_progress[video_id] = progress
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
     
     def update_status(self, video_id: int, status: str):
-        """状態の更新"""
-        for row in range(self.table.rowCount()):
-            item = self.table.item(row, 0)
-            if item and item.data(Qt.UserRole) == video_id:
-                self.table.item(row, 2).setText(status)
-                break
+        """状態の更新（次回のフラッシュでまとめて反映）"""
+        self._pending_status[video_id] = status
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+    
+    def _flush_pending(self):
+        """溜まった進捗・状態の更新を動画ごとに最終値だけ反映"""
+        pending_progress, self._pending_progress = self._pending_progress, {}
+        pending_status, self._pending_status = self._pending_status, {}
+        
+        # 状態と進捗の両方が溜まっている動画も、行の更新（dataChanged）は1回にまとめる
+        for video_id in pending_status.keys() | pending_progress.keys():
+            status = pending_status.get(video_id)
+            tags = None
+            if status == VideoStatus.FIX.value:
+                # 処理が完了した動画はタグが付くので、その行のタグだけ読み直す
+                try:
+                    tags = self.db.get_video_tags(video_id)
+                except Exception as e:
+                    self.logger.error(f"タグの取得中にエラーが発生しました: {str(e)}")
+            self.video_model.update_video(
+                video_id, status=status, progress=pending_progress.get(video_id), tags=tags
+            )
     
     def show_error(self, message: str):
         """エラーメッセージの表示"""
@@ -511,31 +626,22 @@ class MainWindow(QMainWindow):
         )
         
         if result == QMessageBox.Yes:
-            # 処理対象の動画パスを取得
-            video_paths = []
-            for video_id in video_ids:
-                path = self.db.get_video_info(video_id)["file_path"]
-                video_paths.append(path)
+            # 処理対象の動画パスをDBから1回のクエリでまとめて取得（選択順を維持）
+            videos = self.db.get_videos_by_ids(video_ids)
+            video_paths = [videos[video_id]["file_path"] for video_id in video_ids if video_id in videos]
                 
             # 非同期処理を開始
-            asyncio.run_coroutine_threadsafe(
+            asyncio.ensure_future(
                 self.processor.process_multiple_videos(
                     video_paths,
-                    lambda vid, prog: self.signal_emitter.progress_updated.emit(vid, prog),
-                    lambda vid, status: self.signal_emitter.status_updated.emit(vid, status)
-                ),
-                self.loop
+                    self.update_progress,
+                    self.update_status
+                )
             )
     
     def on_cancel_process(self):
         """選択された項目の処理をキャンセル"""
-        selected_rows = self.table.selectedItems()
-        if not selected_rows:
-            return
-        
-        for item in selected_rows:
-            row = item.row()
-            video_id = self.table.item(row, 0).data(Qt.UserRole)
+        for video_id in self._get_selected_video_ids():
             self.processor.cancel_processing(video_id)
     
     def on_reprocess(self, video_id: int, file_path: str):
@@ -556,54 +662,92 @@ class MainWindow(QMainWindow):
             
             self.set_video_status(video_id, VideoStatus.PENDING.value)
             
-            asyncio.run_coroutine_threadsafe(
+            asyncio.ensure_future(
                 self.processor.process_video(
                     file_path, 
-                    lambda vid, prog: self.signal_emitter.progress_updated.emit(vid, prog),
-                    lambda vid, status: self.signal_emitter.status_updated.emit(vid, status)
-                ),
-                self.loop
+                    self.update_progress,
+                    self.update_status
+                )
             )
         except Exception as e:
             self.logger.error(f"動画の再処理中にエラーが発生しました: {str(e)}")
             QMessageBox.critical(self, "Error", f"動画の再処理に失敗しました: {str(e)}")
     
     def refresh_table(self):
-        """テーブルの定期更新"""
+        """
+        動画一覧を読み直す（他のウィンドウや外部ツールでDBが変更された場合に手動で使う）
+        
+        アプリ内での追加・削除・処理状況の変化は該当する行だけ随時反映しているため、定期的な再読込はしない
+        """
         try:
-            videos = self.db.get_all_videos()
-            
-            selected_rows = [item.row() for item in self.table.selectedItems()]
-            scroll_position = self.table.verticalScrollBar().value()
-            
-            self.table.setRowCount(0)
-            
-            for video in videos:
-                if self.current_filter in video["file_name"].lower():
-                    self.add_video_to_table(
-                        video["file_path"],
-                        video["id"],
-                        video["status"],
-                        video["progress"],
-                        video["tags"]  # タグ情報を追加
-                    )
-            
-            for row in selected_rows:
-                if row < self.table.rowCount():
-                    self.table.selectRow(row)
-            
-            self.table.verticalScrollBar().setValue(scroll_position)
-                        
+            # 前回読み込んだ時点から変更がなければ何もしない
+            if self.db.get_videos_signature() == self._last_table_sig:
+                return
+            if self.video_model.rowCount() == 0:
+                self.load_initial_data()
+                return
+            loaded_ids = {self.video_model.video_id_at(row) for row in range(self.video_model.rowCount())}
+            asyncio.ensure_future(self._refresh_loaded_rows(loaded_ids, self._load_generation))
         except Exception as e:
             self.logger.error(f"テーブルの更新中にエラーが発生しました: {str(e)}")
     
+    async def _refresh_loaded_rows(self, loaded_ids: Set[int], generation: int):
+        """
+        読み込み済みの範囲だけDBから読み直し、変わった行だけモデルに反映する
+        
+        状態・進捗・タグが変わった行は書き換え、DBから消えた行は削除し、新しい動画は末尾に追加する。
+        モデルを作り直さないため、選択状態とスクロール位置はそのまま残る
+        """
+        # 開始前にDBの切り替えやフィルタの変更で一覧が読み込み直された場合は何もしない
+        if generation != self._load_generation:
+            return
+        try:
+            sig = self.db.get_videos_signature()
+            videos = await asyncio.to_thread(self._read_videos_down_to, min(loaded_ids), self.current_filter)
+        except Exception as e:
+            self.logger.error(f"テーブルの更新中にエラーが発生しました: {str(e)}")
+            return
+        # 読み込み中に一覧が読み込み直された場合も反映しない
+        if generation != self._load_generation:
+            return
+        
+        current_ids = {video["id"] for video in videos}
+        self.video_model.remove_video_ids(loaded_ids - current_ids)
+        for video in videos:
+            if video["id"] in loaded_ids:
+                self.video_model.update_video(
+                    video["id"], status=video["status"], progress=video.get("progress") or 0,
+                    tags=video.get("tags") or []
+                )
+        self._append_rows([video for video in videos if video["id"] not in loaded_ids])
+        self._last_table_sig = sig
+    
+    def _read_videos_down_to(self, oldest_id: int, name_filter: str) -> List[Dict]:
+        """IDの降順にページ単位で読み、oldest_id以上の動画をすべて返す（ワーカースレッドで実行）"""
+        videos = []
+        before_id = None
+        while True:
+            page = self.db.get_all_videos(per_page=VIDEO_PAGE_SIZE, before_id=before_id,
+                                          name_filter=name_filter or None)
+            videos.extend(video for video in page if video["id"] >= oldest_id)
+            if len(page) < VIDEO_PAGE_SIZE or page[-1]["id"] <= oldest_id:
+                return videos
+            before_id = page[-1]["id"]
+    
     def export_to_csv(self):
         """選択された項目をCSVにエクスポート"""
+        asyncio.ensure_future(self._export_to_csv_async())
+    
+    async def _export_to_csv_async(self):
+        """CSVエクスポートをワーカースレッドで実行（実行中はボタンを無効化）"""
+        self.export_csv_btn.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
         try:
             self.logger.info(f"CSVエクスポート開始 - 使用DB: {self.db.get_database_path()}")
             video_ids = self._get_selected_video_ids()
-            filepath = self.export_manager.export_to_csv(video_ids if video_ids else None)
+            filepath = await asyncio.to_thread(self.export_manager.export_to_csv, video_ids if video_ids else None)
             self.logger.info(f"CSVエクスポート完了: {filepath}")
+            QApplication.restoreOverrideCursor()
             QMessageBox.information(
                 self,
                 "Information",
@@ -611,19 +755,29 @@ class MainWindow(QMainWindow):
             )
             
         except Exception as e:
+            QApplication.restoreOverrideCursor()
             self.logger.error(f"CSVエクスポート中にエラーが発生しました: {str(e)}")
             QMessageBox.critical(
                 self,
                 "Error",
                 f"エクスポート中にエラーが発生しました:\n{str(e)}"
             )
+        finally:
+            self.export_csv_btn.setEnabled(True)
     
     def export_to_json(self):
         """選択された項目をJSONにエクスポート"""
+        asyncio.ensure_future(self._export_to_json_async())
+    
+    async def _export_to_json_async(self):
+        """JSONエクスポートをワーカースレッドで実行（実行中はボタンを無効化）"""
+        self.export_json_btn.setEnabled(False)
+        QApplication.setOverrideCursor(Qt.WaitCursor)
         try:
             video_ids = self._get_selected_video_ids()
             # 選択がない場合はNoneを渡して全件出力
-            filepath = self.export_manager.export_to_json(video_ids if video_ids else None)
+            filepath = await asyncio.to_thread(self.export_manager.export_to_json, video_ids if video_ids else None)
+            QApplication.restoreOverrideCursor()
             QMessageBox.information(
                 self,
                 "Information",
@@ -631,42 +785,26 @@ class MainWindow(QMainWindow):
             )
             
         except Exception as e:
+            QApplication.restoreOverrideCursor()
             self.logger.error(f"JSONエクスポート中にエラーが発生しました: {str(e)}")
             QMessageBox.critical(
                 self,
                 "Error",
                 f"エクスポート中にエラーが発生しました:\n{str(e)}"
             )
+        finally:
+            self.export_json_btn.setEnabled(True)
     
     def _get_selected_video_ids(self) -> List[int]:
-        """選択された項目のvideo_idリストを取得"""
-        video_ids = []
-        processed_rows = set()
-        
-        for item in self.table.selectedItems():
-            row = item.row()
-            if row in processed_rows:
-                continue
-            
-            try:
-                video_id = self.table.item(row, 0).data(Qt.UserRole)
-                if video_id is not None and video_id not in video_ids:
-                    video_ids.append(video_id)
-                processed_rows.add(row)
-                
-            except Exception as e:
-                self.logger.error(f"行 {row} の処理中にエラーが発生: {str(e)}")
-                continue
-        
-        return video_ids
+        """選択された項目のvideo_idリストを取得（表示順）"""
+        return [self.video_model.video_id_at(row) for row in self.get_selected_rows()]
     
     def closeEvent(self, event):
         """ウィンドウを閉じる際の処理"""
         self.config.set_active_database(self.db.get_database_path())
-        
-        if hasattr(self, "loop") and self.loop.is_running():
-            self.loop.call_soon_threadsafe(self.loop.stop)
-        
+        # 処理待ちの解析はイベントループ停止後に走らせない
+        self.processor.shutdown()
+        self.db.close()
         super().closeEvent(event)
 
     def setup_menu_bar(self):
@@ -683,7 +821,17 @@ class MainWindow(QMainWindow):
         
         self.recent_menu = QMenu("Recent Files", self)
         file_menu.addMenu(self.recent_menu)
-        self.update_recent_files_menu()
+        # メニューは表示される直前に必要な場合だけ作り直す
+        self._recent_dirty = True
+        self.recent_menu.aboutToShow.connect(self._populate_recent_menu)
+        # 項目ごとに接続せず、メニュー全体のtriggeredを1回だけ接続する
+        self.recent_menu.triggered.connect(self._on_recent_triggered)
+        
+        file_menu.addSeparator()
+        
+        refresh_action = file_menu.addAction("Refresh")
+        refresh_action.setShortcut("F5")
+        refresh_action.triggered.connect(self.refresh_table)
         
         file_menu.addSeparator()
         
@@ -809,14 +957,11 @@ Visit our website for more help.
     def open_folder(self, folder_type: str):
         """指定されたフォルダをエクスプローラーで開く"""
         try:
-            paths = self.config.get_paths()
-            export_dir = Path(paths.get("export_dir", "./exports"))
-            target_dir = export_dir / folder_type
+            # エクスポート先はExportManagerが決めたディレクトリをそのまま使う（設定の読み直しはしない）
+            target_dir = self.export_manager.export_dir / folder_type
+            target_dir.mkdir(parents=True, exist_ok=True)
             
-            if not target_dir.exists():
-                target_dir.mkdir(parents=True, exist_ok=True)
-            
-            os.startfile(str(target_dir))
+            QDesktopServices.openUrl(QUrl.fromLocalFile(str(target_dir)))
             self.logger.info(f"{folder_type}フォルダを開きました: {target_dir}")
             
         except Exception as e:
@@ -851,39 +996,33 @@ Visit our website for more help.
 
     def update_window_title(self):
         """ウィンドウタイトルを更新（現在のデータベースファイル名を表示）"""
-        db_path = self.db.get_database_path()
-        db_filename = os.path.basename(db_path)
-        self.setWindowTitle(f"MotionTag - Video Tool [{db_filename}]")
+        self.setWindowTitle(f"MotionTag - Video Tool [{self.db.get_database_name()}]")
     
     def refresh_after_db_change(self):
         """データベース変更後の画面更新"""
         self.logger.info(f"データベース変更が検出されました。現在のDB: {self.db.get_database_path()}")
         
-        # ExportManagerのデータベース参照を更新
-        self.export_manager = ExportManager(self.config, self.db)
-        self.logger.info("ExportManagerのデータベース参照を更新しました")
+        # ExportManager・VideoProcessorはインスタンスを作り直さず、データベース参照だけ差し替える
+        self.export_manager.set_database(self.db)
+        self.processor.set_database(self.db)
+        self.logger.info("ExportManager・VideoProcessorのデータベース参照を更新しました")
         
-        # VideoProcessorのデータベース参照を更新
-        # 注意: VideoProcessorは内部でデータベースを生成するため、新しいインスタンスを作成
-        old_processor = self.processor
-        self.processor = VideoProcessor(self.db)
-        # 現在のプロンプト設定を引き継ぐ
-        self.processor.set_prompt_config(old_processor.current_prompt_config)
-        self.logger.info("VideoProcessorのインスタンスを更新しました")
-        
-        # 画面を更新
-        self.refresh_table()
+        # 画面を更新（別DBの行は使い回せないため一度すべて破棄し、起動時と同じくページ単位で読み込む）
+        self.load_initial_data()
         self.update_window_title()
         self.logger.info("データベース変更後の画面更新が完了しました")
     
+    def _populate_recent_menu(self):
+        """最近使用したファイルメニューの表示直前に、変更があれば作り直す"""
+        if not self._recent_dirty:
+            return
+        self.update_recent_files_menu()
+        self._recent_dirty = False
+    
     def update_recent_files_menu(self):
         """最近使用したファイルメニューを更新"""
-        # 設定を再読み込みして最新の状態を取得
-        config_data = self.config._load_json(self.config.config_file)
-        self.logger.debug(f"設定ファイルの内容確認: {config_data}")
-        
-        # 最近使用したファイルのリストを取得
-        recent_files = config_data.get("recent_databases", [])
+        # 最近使用したファイルのリストを取得（設定ファイルが更新されていなければ再読み込みしない）
+        recent_files = self.config.get_recent_databases()
         self.logger.debug(f"最近使用したファイルメニュー更新: 取得したファイル数={len(recent_files)}, ファイル={recent_files}")
         
         # メニューをクリア
@@ -891,17 +1030,39 @@ Visit our website for more help.
         
         # 最近使用したファイルがない場合
         if not recent_files:
-            no_recent = QAction("No recent files", self)
+            no_recent = QAction("No recent files", self.recent_menu)
             no_recent.setEnabled(False)
             self.recent_menu.addAction(no_recent)
             return
         
         # 最近使用したファイルをメニューに追加
         for file_path in recent_files:
-            action = QAction(file_path, self)
-            action.triggered.connect(lambda checked, path=file_path: self.open_database_from_path(path))
+            action = QAction(file_path, self.recent_menu)
+            action.setData(file_path)
             self.recent_menu.addAction(action)
     
+    def _on_recent_triggered(self, action: QAction):
+        """最近使用したファイルメニューの項目が選択された時の処理"""
+        self.open_database_from_path(action.data())
+    
+    def _switch_db(self, db_path: str) -> bool:
+        """
+        使用するデータベースを切り替える
+        
+        設定ファイル（最近使用したDBリストとアクティブなDB）は1回の読み込み・保存で更新する
+        
+        Returns:
+            bool: 切り替えに成功した場合はTrue
+        """
+        if not self.db.change_database(db_path, record_recent=False):
+            return False
+        self.logger.debug(f"データベース変更成功: {db_path}")
+        
+        self.config.switch_database(self.db.get_database_path())
+        self._recent_dirty = True
+        self.database_changed.emit()
+        return True
+    
     def create_new_database(self):
         """新しいデータベースファイルを作成"""
         # ファイル選択ダイアログ
@@ -918,14 +1079,7 @@ Visit our website for more help.
         try:
             self.logger.debug(f"新しいデータベースを作成します: {file_path}")
             
-            if self.db.create_new_database(file_path):
-                self.logger.debug(f"データベース作成成功: {file_path}")
-                
-                self.update_recent_files_menu()
-                
-                self.config.set_active_database(file_path)
-                
-                self.signal_emitter.database_changed.emit()
+            if self._switch_db(file_path):
                 self.logger.info(f"新しいデータベースを作成しました: {file_path}")
             else:
                 QMessageBox.critical(self, "Error", "Failed to create database.")
@@ -953,15 +1107,7 @@ Visit our website for more help.
         try:
             self.logger.debug(f"データベースを開こうとしています: {file_path}")
             
-            # データベースを変更
-            if self.db.change_database(file_path):
-                self.logger.debug(f"データベース変更成功: {file_path}")
-                
-                self.update_recent_files_menu()
-                
-                self.config.set_active_database(file_path)
-                
-                self.signal_emitter.database_changed.emit()
+            if self._switch_db(file_path):
                 self.logger.info(f"データベースを開きました: {file_path}")
             else:
                 QMessageBox.critical(self, "Error", "Failed to open database.")
@@ -976,14 +1122,7 @@ Visit our website for more help.
             default_db_path = self.config.get_paths()["db_path"]
             self.logger.debug(f"デフォルトデータベースに戻ります: {default_db_path}")
             
-            if self.db.change_database(default_db_path):
-                self.logger.debug(f"データベース変更成功（デフォルトに戻りました）")
-                
-                self.update_recent_files_menu()
-                
-                self.config.set_active_database(default_db_path)
-                
-                self.signal_emitter.database_changed.emit()
+            if self._switch_db(default_db_path):
                 self.logger.info("デフォルトデータベースに戻りました")
             else:
                 QMessageBox.critical(self, "Error", "Failed to return to default database.")
@@ -1000,50 +1139,65 @@ Visit our website for more help.
         """ビデオのステータスを設定"""
         try:
             self.db.update_video_status(video_id, status)
-            self.refresh_table()
+            # 一覧全体は読み直さず、該当する行だけ更新する
+            self.video_model.update_video(video_id, status=status)
         except Exception as e:
             self.logger.error(f"ビデオステータス更新中にエラーが発生: {str(e)}", exc_info=True)
             self.show_error(f"ステータス更新中にエラーが発生しました: {str(e)}")
     
+    def _existing_files(self, file_paths) -> set:
+        """
+        実在するファイルパスの集合を取得
+        
+        ファイルごとにstat()せず、親ディレクトリごとに1回だけos.scandirで一覧を取得して照合する
+        """
+        by_dir: Dict[str, List[str]] = {}
+        for file_path in file_paths:
+            by_dir.setdefault(os.path.dirname(file_path), []).append(file_path)
+        
+        existing = set()
+        for directory, paths in by_dir.items():
+            try:
+                with os.scandir(directory or ".") as entries:
+                    names = {os.path.normcase(entry.name) for entry in entries}
+                existing.update(p for p in paths if os.path.normcase(os.path.basename(p)) in names)
+            except OSError as e:
+                # 一覧を取得できないディレクトリはファイルごとに確認する
+                self.logger.debug(f"ディレクトリの一覧取得に失敗しました: {directory}: {str(e)}")
+                existing.update(p for p in paths if os.path.exists(p))
+        return existing
+    
     def add_video_files(self, file_paths):
         """ビデオファイルをデータベースに追加"""
         try:
-            added = []
-            
+            existing_files = self._existing_files(file_paths)
+            new_paths = []
             for file_path in file_paths:
-                if not os.path.exists(file_path):
+                if file_path not in existing_files:
                     self.logger.warning(f"ファイルが存在しません: {file_path}")
                     continue
                     
-                # 重複チェックを追加
-                try:
-                    conn = self.db._get_connection()
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT id FROM videos WHERE file_path = ?", (file_path,))
-                    existing = cursor.fetchone()
-                    conn.close()
-                    if existing:
-                        video_id = existing[0]
-                        self.logger.info(f"重複ファイル検出: {file_path} (video_id={video_id})")
-                        # 自動で消える通知を表示（非モーダル）
-                        AutoCloseMessageBox("重複ファイル", f"ファイル '{os.path.basename(file_path)}' は既に追加されています。重複をスキップします。", 1500, self)
-                        continue
-                except Exception as e:
-                    self.logger.error(f"重複チェック中にエラーが発生しました: {str(e)}", exc_info=True)
-                
-                file_name = os.path.basename(file_path)
-                video_id = self.db.add_video(file_path, file_name)
+                if self.db.is_known_path(file_path):
+                    self.logger.info(f"重複ファイル検出: {file_path}")
+                    # 自動で消える通知を表示（非モーダル）
+                    AutoCloseMessageBox("重複ファイル", f"ファイル '{os.path.basename(file_path)}' は既に追加されています。重複をスキップします。", 1500, self)
+                    continue
                 
-                if video_id:
-                    added.append((video_id, file_path))
+                new_paths.append(file_path)
+            
+            # 1つのトランザクションでまとめて追加
+            video_ids = self.db.add_videos_bulk(new_paths)
+            added = list(zip(video_ids, new_paths))
             
             if added:
                 self.logger.info(f"{len(added)}件のビデオを追加しました")
-                self.refresh_table()
+                self._append_rows([
+                    {"id": video_id, "file_path": file_path, "status": VideoStatus.get_default(), "progress": 0, "tags": []}
+                    for video_id, file_path in added
+                ])
                 
                 if self.auto_process.isChecked():
-                    for video_id, file_path in added:
-                        self.process_video(video_id, file_path)
+                    self._start_processing(new_paths)
             
             return len(added)
             
@@ -1054,8 +1208,8 @@ Visit our website for more help.
     
     def delete_selected_videos(self):
         """選択されたビデオを削除"""
-        selected_rows = self.get_selected_rows()
-        if not selected_rows:
+        video_ids = self._get_selected_video_ids()
+        if not video_ids:
             QMessageBox.information(self, "Information", "Please select videos to delete.")
             return
         
@@ -1064,16 +1218,12 @@ Visit our website for more help.
         
         if reply == QMessageBox.Yes:
             try:
-                for row in sorted(selected_rows, reverse=True):
-                    # UserRoleに設定したvideo_idを取得
-                    video_id = self.table.item(row, 0).data(Qt.UserRole)
-                    self.logger.debug(f"Deleting video_id={video_id}, row={row}")
-                    if video_id is None:
-                        continue
-                    self.db.delete_video(video_id)
+                # 1つのトランザクションでまとめて削除
+                self.db.delete_videos(video_ids)
                 
-                self.logger.info(f"{len(selected_rows)}件のビデオを削除しました")
-                self.refresh_table()
+                self.logger.info(f"{len(video_ids)}件のビデオを削除しました")
+                # 一覧全体は読み直さず、削除した行だけ取り除く
+                self.video_model.remove_video_ids(video_ids)
                 
             except Exception as e:
                 self.logger.error(f"ビデオ削除中にエラーが発生: {str(e)}", exc_info=True)
@@ -1090,24 +1240,26 @@ Visit our website for more help.
     
     def process_selected_videos(self):
         """選択されたビデオの処理を開始"""
-        selected_rows = self.get_selected_rows()
-        if not selected_rows:
+        video_ids = self._get_selected_video_ids()
+        if not video_ids:
             QMessageBox.information(self, "Information", "処理するビデオを選択してください。")
             return
         
         prompt_name = self.prompt_combo.currentText()
         
-        for row in selected_rows:
-            video_id = int(self.table.item(row, 0).text())
-            file_path = self.table.item(row, 1).text()
-            
-            status = self.table.item(row, 3).text()
-            if status == VideoStatus.PROCESSING:
-                continue
-            
-            self.db.update_video_prompt(video_id, prompt_name)
-            
-            self.process_video(video_id, file_path)
+        # パスと状態はDBから1回のクエリでまとめて取得
+        videos = self.db.get_videos_by_ids(video_ids)
+        targets = [
+            (video_id, videos[video_id]["file_path"])
+            for video_id in video_ids
+            if video_id in videos and videos[video_id]["status"] != VideoStatus.PROCESSING.value
+        ]
+        
+        # プロンプト名は1つのトランザクションで更新
+        self.db.update_videos_prompt([video_id for video_id, _ in targets], prompt_name)
+        
+        for video_id, file_path in targets:
+            asyncio.ensure_future(self.process_video(video_id, file_path))
 
     def open_table_context_menu(self, position):
         """テーブルのコンテキストメニューを表示"""
@@ -1118,6 +1270,14 @@ Visit our website for more help.
         menu.exec(self.table.viewport().mapToGlobal(position))
 
     def get_selected_rows(self) -> List[int]:
-        """選択された行番号のリストを取得"""
-        # 選択された行のインデックスを取得
-        return [idx.row() for idx in self.table.selectionModel().selectedRows()] 
\ No newline at end of file
+        """
+        選択された行番号のリストを取得（昇順）
+        
+        行単位で選択しているため、selectedRows()のように行ごと・列ごとに選択状態を調べず、
+        選択範囲の上端から下端までの行番号をそのまま使う
+        選択範囲には非表示の行も含まれる（Ctrl+Aなど）ため、それらは除外する
+        """
+        rows = set()
+        for selection_range in self.table.selectionModel().selection():
+            rows.update(range(selection_range.top(), selection_range.bottom() + 1))
+        return sorted(row for row in rows if not self.table.isRowHidden(row)) 
\ No newline at end of file
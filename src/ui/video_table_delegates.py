@@ -0,0 +1,59 @@
+from PySide6.QtCore import Qt, QEvent, Signal
+from PySide6.QtWidgets import (
+    QStyledItemDelegate, QStyle, QStyleOptionProgressBar, QStyleOptionButton, QApplication
+)
+
+
+class ProgressBarDelegate(QStyledItemDelegate):
+    """セルの値（0〜100）を進捗バーとして描画するデリゲート"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 描画用のオプションはセルごとに作らず使い回す（描画はGUIスレッドでのみ行われる）
+        self._bar = QStyleOptionProgressBar()
+        self._bar.minimum = 0
+        self._bar.maximum = 100
+        self._bar.textVisible = True
+
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        progress = int(index.data(Qt.DisplayRole) or 0)
+        bar = self._bar
+        bar.rect = option.rect.adjusted(2, 2, -2, -2)
+        bar.state = option.state | QStyle.State_Horizontal
+        bar.progress = progress
+        bar.text = f"{progress}%"
+        style.drawControl(QStyle.CE_ProgressBar, bar, painter, option.widget)
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """セルの表示文字列をボタンとして描画し、クリックされた行番号を通知するデリゲート"""
+
+    clicked = Signal(int)  # row
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # 描画用のオプションはセルごとに作らず使い回す（描画はGUIスレッドでのみ行われる）
+        self._button = QStyleOptionButton()
+        self._button.state = QStyle.State_Enabled | QStyle.State_Raised
+
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, option, painter, option.widget)
+
+        button = self._button
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = str(index.data(Qt.DisplayRole) or "")
+        style.drawControl(QStyle.CE_PushButton, button, painter, option.widget)
+
+    def editorEvent(self, event, model, option, index):
+        # ボタン上での押下は選択状態を変えずに消費し、離した時にクリックを通知する
+        if event.type() in (QEvent.MouseButtonPress, QEvent.MouseButtonDblClick):
+            return event.button() == Qt.LeftButton
+        if event.type() == QEvent.MouseButtonRelease and event.button() == Qt.LeftButton:
+            if option.rect.contains(event.position().toPoint()):
+                self.clicked.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
@@ -0,0 +1,252 @@
+import os
+import asyncio
+from typing import List, Dict, Optional, Iterable, Callable, Awaitable
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# カラム番号
+COL_NAME = 0
+COL_OPEN = 1
+COL_STATUS = 2
+COL_PROGRESS = 3
+COL_TAGS = 4
+COL_ACTIONS = 5
+
+HEADER_LABELS = ["Video Name", "Open", "Status", "Progress", "Tags", "Actions"]
+
+# 行データ（リスト）内の位置
+_ID = 0
+_PATH = 1
+_NAME = 2
+_STATUS = 3
+_PROGRESS = 4
+_TAGS = 5
+
+# data()で値を返すロール（描画時にはセルごとに多数のロールが問い合わせられるため、それ以外は即座にNoneを返す）
+_SERVED_ROLES = frozenset((Qt.DisplayRole, Qt.UserRole, Qt.ToolTipRole))
+
+
+class VideoTableModel(QAbstractTableModel):
+    """
+    動画一覧のテーブルモデル
+
+    1行を [video_id, file_path, file_name, status, progress, tags_text] のリストで保持し、
+    表示はビューが必要な時にdata()から取得する。
+    set_page_source()で読み込み元を設定すると、ビューがスクロールに応じてfetchMore()でページ単位に行を追加する。
+    ページの取得は待たずにイベントループへ戻り、取得できた時点で行を追加する。
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: List[list] = []
+        self._row_by_id: Dict[int, int] = {}  # video_id -> 行番号
+        # ページ単位の読み込み（fetch_page(before_id) はbefore_idより古い動画を最大page_size件返すコルーチン）
+        self._fetch_page: Optional[Callable[[Optional[int]], Awaitable[List[Dict]]]] = None
+        self._page_size = 0
+        self._next_before_id: Optional[int] = None
+        self._has_more = False
+        self._loading = False  # ページの取得中はTrue（同じページを重ねて要求しない）
+        self._load_generation = 0  # 読み込み元を設定し直すたびに増やし、前の読み込み元の結果を捨てる
+
+    @staticmethod
+    def _make_row(video: Dict) -> list:
+        """get_all_videos()形式の辞書から行データを作成"""
+        tags = video.get("tags")
+        # DBに保存済みのファイル名があればそのまま使い、パスの解析は省く
+        name = video.get("file_name") or os.path.basename(video["file_path"])
+        return [
+            video["id"],
+            video["file_path"],
+            name,
+            video["status"],
+            video.get("progress") or 0,
+            ", ".join(tags) if tags else ""
+        ]
+
+    def _rebuild_index(self, start: int):
+        """start行目以降のvideo_id -> 行番号の対応を作り直す（start行目より前の行は変わらないので触らない）"""
+        for i in range(start, len(self._rows)):
+            self._row_by_id[self._rows[i][_ID]] = i
+
+    # --- QAbstractTableModel ---
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADER_LABELS)
+
+    def data(self, index: QModelIndex, role=Qt.DisplayRole):
+        if role not in _SERVED_ROLES or not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == COL_NAME:
+                return row[_NAME]
+            if column == COL_OPEN:
+                return "🎬"
+            if column == COL_STATUS:
+                return row[_STATUS]
+            if column == COL_PROGRESS:
+                return row[_PROGRESS]
+            if column == COL_TAGS:
+                return row[_TAGS]
+            if column == COL_ACTIONS:
+                return "▶Run"
+        elif role == Qt.UserRole:
+            return row[_ID]
+        elif role == Qt.ToolTipRole:
+            if column == COL_NAME:
+                return row[_PATH]
+            if column == COL_OPEN:
+                return "Open Video"
+        return None
+
+    def headerData(self, section: int, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADER_LABELS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more and not self._loading
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self._has_more or self._loading:
+            return
+        self._loading = True
+        asyncio.ensure_future(self._load_next_page(self._load_generation))
+
+    async def _load_next_page(self, generation: int):
+        """次のページを取得して末尾に追加（取得中に読み込み元が設定し直された場合は結果を捨てる）"""
+        videos = await self._fetch_page(self._next_before_id)
+        if generation != self._load_generation:
+            return
+        self._loading = False
+        if len(videos) < self._page_size:
+            self._has_more = False
+        if videos:
+            # 前のページの最後のIDから続けて読む（読み込み中に追加済みの動画はappend_videosで除外される）
+            self._next_before_id = videos[-1]["id"]
+            self.append_videos(videos)
+
+    # --- 行の参照 ---
+
+    def video_id_at(self, row: int) -> int:
+        """行番号からvideo_idを取得"""
+        return self._rows[row][_ID]
+
+    def file_path_at(self, row: int) -> str:
+        """行番号から動画パスを取得"""
+        return self._rows[row][_PATH]
+
+    # --- 行の更新 ---
+
+    def set_page_source(self, fetch_page: Callable[[Optional[int]], Awaitable[List[Dict]]], page_size: int):
+        """
+        全行を破棄し、以降はfetch_pageからページ単位で読み込む
+
+        最初のページ以降は、ビューが末尾付近まで表示した時にfetchMore()で読み込まれる
+        """
+        self.beginResetModel()
+        self._rows = []
+        self._row_by_id = {}
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._next_before_id = None
+        self._has_more = True
+        self._loading = False
+        self._load_generation += 1
+        self.endResetModel()
+
+    def append_videos(self, videos: Iterable[Dict]) -> int:
+        """
+        末尾に行をまとめて追加（既に存在するvideo_idは無視）
+
+        Returns:
+            int: 追加した行数
+        """
+        new_rows = []
+        seen = set()
+        for video in videos:
+            if video["id"] in self._row_by_id or video["id"] in seen:
+                continue
+            seen.add(video["id"])
+            new_rows.append(self._make_row(video))
+        if not new_rows:
+            return 0
+
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(new_rows) - 1)
+        for i, row in enumerate(new_rows, start):
+            self._rows.append(row)
+            self._row_by_id[row[_ID]] = i
+        self.endInsertRows()
+        return len(new_rows)
+
+    def _set_row_values(self, i: int, status: Optional[str], progress: Optional[int],
+                        tags: Optional[List[str]]) -> List[int]:
+        """行の状態・進捗・タグを書き換え、値が変化したカラム番号を返す（シグナルは発行しない）"""
+        row = self._rows[i]
+        changed = []
+        if status is not None and row[_STATUS] != status:
+            row[_STATUS] = status
+            changed.append(COL_STATUS)
+        if progress is not None and row[_PROGRESS] != progress:
+            row[_PROGRESS] = progress
+            changed.append(COL_PROGRESS)
+        if tags is not None:
+            tag_text = ", ".join(tags) if tags else ""
+            if row[_TAGS] != tag_text:
+                row[_TAGS] = tag_text
+                changed.append(COL_TAGS)
+        return changed
+
+    def update_video(self, video_id: int, status: Optional[str] = None, progress: Optional[int] = None,
+                     tags: Optional[List[str]] = None) -> bool:
+        """
+        1行の状態・進捗・タグを更新し、変化したセルだけdataChangedを発行
+
+        Returns:
+            bool: 行が存在した場合はTrue
+        """
+        i = self._row_by_id.get(video_id)
+        if i is None:
+            return False
+
+        changed = self._set_row_values(i, status, progress, tags)
+        if changed:
+            self.dataChanged.emit(
+                self.index(i, min(changed)),
+                self.index(i, max(changed)),
+                [Qt.DisplayRole]
+            )
+        return True
+
+    def remove_video_ids(self, video_ids: Iterable[int]) -> int:
+        """
+        指定されたvideo_idの行を削除（連続する行はまとめて削除）
+
+        Returns:
+            int: 削除した行数
+        """
+        removed_ids = [video_id for video_id in set(video_ids) if video_id in self._row_by_id]
+        if not removed_ids:
+            return 0
+        rows = sorted((self._row_by_id.pop(video_id) for video_id in removed_ids), reverse=True)
+
+        # 下から連続する範囲ごとに削除
+        end = start = rows[0]
+        for row in rows[1:] + [None]:
+            if row is not None and row == start - 1:
+                start = row
+                continue
+            self.beginRemoveRows(QModelIndex(), start, end)
+            del self._rows[start:end + 1]
+            self.endRemoveRows()
+            if row is not None:
+                end = start = row
+
+        # 削除した最初の行より後ろの行番号だけ詰め直す
+        self._rebuild_index(rows[-1])
+        return len(rows)
@@ -1,6 +1,9 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set, Iterator
 from .db_manager import DatabaseManager
 
+# 検索用インデックスの文字n-gramの長さ（これより短いクエリは全件を走査する）
+SEARCH_GRAM_SIZE = 3
+
 class DataManager:
     def __init__(self, db_path: str):
         """
@@ -9,9 +12,15 @@ class DataManager:
             db_path (str): データベースファイルのパス
         """
         self.db_path = db_path
+        # 接続は最初に1回だけ開き、以降の読み込み・更新で使い回す
         self._db_manager = DatabaseManager(db_path)
+        self._db_manager.connect()
         self._cache = {}
 
+    def close(self):
+        """データベース接続を閉じる"""
+        self._db_manager.close()
+
     def load_all_videos(self) -> List[Dict[str, Any]]:
         """
         全ての動画情報を読み込む
@@ -21,8 +30,47 @@ class DataManager:
         with self._db_manager as db:
             videos = db.get_all_videos()
             self._cache['videos'] = videos
+            # 検索インデックスと絞り込み用の値は次に使う時に作り直す
+            self._cache.pop('search_index', None)
+            self._cache.pop('filter_values', None)
             return videos
 
+    def iter_videos(self) -> Iterator[Dict[str, Any]]:
+        """
+        キャッシュを使わずに全ての動画情報を1件ずつ読み込む（エクスポートなど、一度だけ走査する用途向け）
+        Yields:
+            Dict[str, Any]: 動画情報
+        """
+        yield from self._db_manager.iter_videos()
+
+    @staticmethod
+    def _grams(text: str) -> Set[str]:
+        """文字列に含まれる長さSEARCH_GRAM_SIZEの部分文字列の集合"""
+        return {text[i:i + SEARCH_GRAM_SIZE] for i in range(len(text) - SEARCH_GRAM_SIZE + 1)}
+
+    def _get_search_index(self) -> Dict[str, Any]:
+        """
+        検索インデックスを取得（未作成ならキャッシュ中の動画から作成）
+        Returns:
+            Dict[str, Any]: texts（動画ごとの小文字のファイル名とタグ）とgrams（n-gram -> 動画の位置の集合）
+        """
+        index = self._cache.get('search_index')
+        if index is not None:
+            return index
+
+        texts = []
+        grams: Dict[str, Set[int]] = {}
+        for i, video in enumerate(self._cache['videos']):
+            name = video['file_name'].lower()
+            tags = video['tags'].lower() if video.get('tags') else ''
+            texts.append((name, tags))
+            for gram in self._grams(name) | self._grams(tags):
+                grams.setdefault(gram, set()).add(i)
+
+        index = {'texts': texts, 'grams': grams}
+        self._cache['search_index'] = index
+        return index
+
     def update_video_tags(self, video_id: int, tags: List[str]) -> bool:
         """
         動画のタグを更新
@@ -42,6 +90,8 @@ class DataManager:
                     if video['id'] == video_id:
                         video['tags'] = ','.join(tags)
                         break
+                self._cache.pop('search_index', None)
+                self._cache.pop('filter_values', None)
             
             return True
         except Exception as e:
@@ -60,10 +110,23 @@ class DataManager:
             self.load_all_videos()
         
         query = query.lower()
+        videos = self._cache['videos']
+        index = self._get_search_index()
+        texts = index['texts']
+
+        if len(query) < SEARCH_GRAM_SIZE:
+            candidates = range(len(videos))
+        else:
+            # クエリの全n-gramを含む動画に絞り込んでから部分一致を確認する
+            postings = sorted(
+                (index['grams'].get(gram, set()) for gram in self._grams(query)),
+                key=len
+            )
+            candidates = sorted(set.intersection(*postings))
+
         return [
-            video for video in self._cache['videos']
-            if query in video['file_name'].lower() or
-               (video.get('tags') and query in video['tags'].lower())
+            videos[i] for i in candidates
+            if query in texts[i][0] or query in texts[i][1]
         ]
 
     def filter_videos(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -77,16 +140,34 @@ class DataManager:
         if not self._cache.get('videos'):
             self.load_all_videos()
         
-        filtered_videos = self._cache['videos']
-        
-        for key, value in filters.items():
-            if value:
-                filtered_videos = [
-                    video for video in filtered_videos
-                    if str(video.get(key, '')).lower() == str(value).lower()
-                ]
+        videos = self._cache['videos']
+        # 条件の値は一度だけ小文字化し、動画側の値は項目ごとに小文字化済みの一覧を使い回す
+        conditions = [
+            (self._get_filter_values(key), str(value).lower())
+            for key, value in filters.items() if value
+        ]
+        if not conditions:
+            return videos
         
-        return filtered_videos
+        return [
+            video for i, video in enumerate(videos)
+            if all(values[i] == value for values, value in conditions)
+        ]
+
+    def _get_filter_values(self, key: str) -> List[str]:
+        """
+        絞り込み用に、キャッシュ中の全動画のkeyの値を小文字の文字列にした一覧を取得
+        Args:
+            key (str): 動画情報の項目名
+        Returns:
+            List[str]: キャッシュ中の動画と同じ順の値の一覧
+        """
+        columns = self._cache.setdefault('filter_values', {})
+        values = columns.get(key)
+        if values is None:
+            values = [str(video.get(key, '')).lower() for video in self._cache['videos']]
+            columns[key] = values
+        return values
 
     def update_character_info(self, video_id: int, gender: str, age_group: str, body_type: str) -> bool:
         """
@@ -111,6 +192,7 @@ class DataManager:
                         video['character_age_group'] = age_group
                         video['character_body_type'] = body_type
                         break
+                self._cache.pop('filter_values', None)
             
             return True
         except Exception as e:
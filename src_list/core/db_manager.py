@@ -1,7 +1,13 @@
 import sqlite3
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterator
 import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# 動画一覧をカーソルから一度に読み込む行数
+VIDEO_FETCH_SIZE = 1000
 
 class DatabaseManager:
     def __init__(self, db_path: str):
@@ -13,20 +19,52 @@ class DatabaseManager:
         self.db_path = db_path
         self._connection = None
         self._cursor = None
+        # video_id -> (保存されているresult_jsonの文字列, 解析済みの辞書)
+        # 文字列が一致する間は再解析しない（本体による書き換えは文字列の違いで検知する）
+        self._json_cache: Dict[int, tuple] = {}
 
     def connect(self):
-        """データベースに接続"""
+        """データベースに接続（接続済みの場合は既存の接続をそのまま使う）"""
+        if self._connection is not None:
+            return
         try:
             self._connection = sqlite3.connect(self.db_path)
+            # 動画解析ツール本体（src/core/database.py）と同じ設定で開く
+            # （WALのため、本体が書き込み中でも読み込みは待たされない）
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute("PRAGMA temp_store=MEMORY")
+            self._connection.execute("PRAGMA cache_size=-8192")
+            self._connection.execute("PRAGMA mmap_size=268435456")
             self._cursor = self._connection.cursor()
         except sqlite3.Error as e:
-            print(f"データベース接続エラー: {e}")
+            logger.error(f"データベース接続エラー: {e}")
             raise
+        self._ensure_indexes()
+
+    def _ensure_indexes(self):
+        """
+        一覧取得の結合で使うインデックスを作成（作成済みの場合は何もしない）
+
+        本体で一度も開いていない古いデータベースファイルにも作成されるよう、接続時に確認する
+        """
+        try:
+            self._cursor.execute("CREATE INDEX IF NOT EXISTS idx_analysis_results_video_id ON analysis_results (video_id)")
+            self._cursor.execute("CREATE INDEX IF NOT EXISTS idx_tags_video_id ON tags (video_id)")
+            self._connection.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"インデックスの作成に失敗しました: {e}")
 
     def disconnect(self):
         """データベース接続を閉じる"""
         if self._connection:
             self._connection.close()
+            self._connection = None
+            self._cursor = None
+
+    def close(self):
+        """アプリケーション終了時などに接続を閉じる"""
+        self.disconnect()
 
     def get_all_videos(self) -> List[Dict[str, Any]]:
         """
@@ -35,50 +73,61 @@ class DatabaseManager:
             List[Dict[str, Any]]: 動画情報のリスト
         """
         try:
-            print("=== データベース取得開始 ===")
-            self._cursor.execute("""
+            result = list(self.iter_videos())
+        except sqlite3.Error:
+            return []
+        # 行ごとには出力せず、件数と先頭行だけを記録する
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"動画一覧を取得しました: {len(result)}件 先頭行: {result[:1]}")
+        return result
+
+    def iter_videos(self) -> Iterator[Dict[str, Any]]:
+        """
+        全ての動画情報を1件ずつ取得（VIDEO_FETCH_SIZE行ずつ読み込み、全件をリストにしない）
+
+        読み込み中に他の問い合わせでカーソルが上書きされないよう、専用のカーソルを使う
+        Yields:
+            Dict[str, Any]: 動画情報
+        Raises:
+            sqlite3.Error: 読み込みに失敗した場合（途中までの結果を全件として扱わせない）
+        """
+        cursor = self._connection.cursor()
+        try:
+            cursor.execute("""
                 SELECT 
                     v.id,
                     v.file_path,
                     v.file_name,
-                    json_extract(ar.result_json, '$.character_gender') as character_gender,
-                    json_extract(ar.result_json, '$.character_age_group') as character_age_group,
-                    json_extract(ar.result_json, '$.character_body_type') as character_body_type,
-                    json_extract(ar.result_json, '$.Name of AnimationFile') as animation_file_name,
+                    -- キャラクター情報・アニメーション名はresult_jsonを解析せずにカラムから読む
+                    ar.character_gender,
+                    ar.character_age_group,
+                    ar.character_body_type,
+                    ar.animation_name as animation_file_name,
                     ar.result_json,
                     ar.param_01,
                     ar.param_02,
                     ar.param_03,
-                    GROUP_CONCAT(t.tag) as tags
+                    -- タグは動画ごとにインデックスから集計する（結合結果全体を集計し直さない）
+                    (SELECT GROUP_CONCAT(tag) FROM tags WHERE video_id = v.id) as tags
                 FROM videos v
-                LEFT JOIN analysis_results ar ON v.id = ar.video_id
-                LEFT JOIN tags t ON v.id = t.video_id
-                GROUP BY v.id
+                -- 解析結果は動画ごとに最新の1件だけを結合する
+                LEFT JOIN analysis_results ar ON ar.id = (
+                    SELECT MAX(id) FROM analysis_results WHERE video_id = v.id
+                )
             """)
-            columns = [description[0] for description in self._cursor.description]
-            print(f"カラム名: {columns}")
-            
-            # デバッグ用：取得したデータの内容を確認
-            rows = self._cursor.fetchall()
-            result = []
-            for row in rows:
-                row_dict = dict(zip(columns, row))
-                print(f"\n行データ: {row_dict}")
-                print(f"性別: {row_dict.get('character_gender')}")
-                print(f"年齢: {row_dict.get('character_age_group')}")
-                print(f"体型: {row_dict.get('character_body_type')}")
-                print(f"アニメーションファイル名: {row_dict.get('animation_file_name')}")
-                print(f"カスタムパラメータ1: {row_dict.get('param_01')}")
-                print(f"カスタムパラメータ2: {row_dict.get('param_02')}")
-                print(f"カスタムパラメータ3: {row_dict.get('param_03')}")
-                result.append(row_dict)
-            
-            print("=== データベース取得終了 ===")
-            return result
+            columns = [description[0] for description in cursor.description]
+            while True:
+                rows = cursor.fetchmany(VIDEO_FETCH_SIZE)
+                if not rows:
+                    break
+                for row in rows:
+                    yield dict(zip(columns, row))
             
         except sqlite3.Error as e:
-            print(f"データ取得エラー: {e}")
-            return []
+            logger.error(f"データ取得エラー: {e}")
+            raise
+        finally:
+            cursor.close()
 
     def update_tags(self, video_id: int, tags: List[str], source: str = 'manual'):
         """
@@ -92,17 +141,16 @@ class DatabaseManager:
             # 既存のタグを削除
             self._cursor.execute("DELETE FROM tags WHERE video_id = ?", (video_id,))
             
-            # 新しいタグを追加
+            # 新しいタグを1つの文で追加（削除と同じトランザクションでまとめてコミット）
             current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            for tag in tags:
-                self._cursor.execute(
-                    "INSERT INTO tags (video_id, tag, source, created_at) VALUES (?, ?, ?, ?)",
-                    (video_id, tag, source, current_time)
-                )
+            self._cursor.executemany(
+                "INSERT INTO tags (video_id, tag, source, created_at) VALUES (?, ?, ?, ?)",
+                [(video_id, tag, source, current_time) for tag in tags]
+            )
             
             self._connection.commit()
         except sqlite3.Error as e:
-            print(f"タグ更新エラー: {e}")
+            logger.error(f"タグ更新エラー: {e}")
             self._connection.rollback()
             raise
 
@@ -116,19 +164,19 @@ class DatabaseManager:
             body_type (str): 体型
         """
         try:
-            # 既存のresult_jsonを取得
+            # 一覧に表示している最新の解析結果のresult_jsonを取得
             self._cursor.execute("""
-                SELECT result_json
+                SELECT id, result_json
                 FROM analysis_results
                 WHERE video_id = ?
+                ORDER BY id DESC
+                LIMIT 1
             """, (video_id,))
             
             row = self._cursor.fetchone()
             if row:
-                result_json = row[0]
-                if isinstance(result_json, str):
-                    result_json = result_json.replace("'", '"')
-                    result_json = json.loads(result_json)
+                result_id = row[0]
+                result_json = self._parse_result_json(video_id, row[1])
                 
                 # キャラクター情報を更新
                 result_json['character_gender'] = gender
@@ -136,26 +184,55 @@ class DatabaseManager:
                 result_json['character_body_type'] = body_type
                 
                 # 更新を実行
+                result_text = json.dumps(result_json)
+                # 一覧はカラムから読むため、result_jsonと合わせて更新する
                 self._cursor.execute("""
                     UPDATE analysis_results
-                    SET result_json = ?
-                    WHERE video_id = ?
-                """, (json.dumps(result_json), video_id))
+                    SET result_json = ?, character_gender = ?, character_age_group = ?, character_body_type = ?
+                    WHERE id = ?
+                """, (result_text, gender, age_group, body_type, result_id))
                 
                 self._connection.commit()
+                # 書き込んだ内容を次回の編集で再解析せずに使う
+                self._json_cache[video_id] = (result_text, result_json)
             else:
-                print(f"video_id {video_id} の解析結果が見つかりません")
+                logger.warning(f"video_id {video_id} の解析結果が見つかりません")
                 
         except sqlite3.Error as e:
-            print(f"キャラクター情報更新エラー: {e}")
+            logger.error(f"キャラクター情報更新エラー: {e}")
             self._connection.rollback()
             raise
 
+    def _parse_result_json(self, video_id: int, raw) -> Dict[str, Any]:
+        """
+        result_jsonを辞書に変換（前回と同じ文字列ならキャッシュを返す）
+
+        JSONとして読めない場合のみ、シングルクォートをダブルクォートに置換して解析し直す
+        """
+        if not isinstance(raw, str):
+            return raw
+        cached = self._json_cache.get(video_id)
+        if cached is not None and cached[0] == raw:
+            return cached[1]
+        try:
+            parsed = json.loads(raw)
+        except json.JSONDecodeError:
+            parsed = json.loads(raw.replace("'", '"'))
+        self._json_cache[video_id] = (raw, parsed)
+        return parsed
+
     def __enter__(self):
-        """コンテキストマネージャーのエントリーポイント"""
+        """
+        コンテキストマネージャーのエントリーポイント
+
+        接続は操作ごとに開き直さず使い回す（未接続の場合のみ接続する）
+        """
         self.connect()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """コンテキストマネージャーの終了処理"""
-        self.disconnect() 
\ No newline at end of file
+        """コンテキストマネージャーの終了処理（接続は閉じず、トランザクションだけを確定または取り消す）"""
+        if exc_type is None:
+            self._connection.commit()
+        else:
+            self._connection.rollback() 
\ No newline at end of file
@@ -127,6 +127,8 @@ class MainWindow(QMainWindow):
                 )
             
             if db_path:
+                if self.data_manager:
+                    self.data_manager.close()
                 self.data_manager = DataManager(db_path)
                 self._refresh_data()
                 self.statusBar().showMessage(f"データベース接続成功: {db_path}")
@@ -139,20 +141,22 @@ class MainWindow(QMainWindow):
                 f"データベース接続エラー: {str(e)}"
             )
 
+    def closeEvent(self, event):
+        """ウィンドウを閉じる時にデータベース接続を閉じる"""
+        if self.data_manager:
+            self.data_manager.close()
+        super().closeEvent(event)
+
     def _refresh_data(self):
         """データを更新"""
         if self.data_manager:
             try:
-                print("=== データ更新開始 ===")
-                print(f"更新前の選択行: {[item.row() for item in self.table.selectedItems()]}")
                 videos = self.data_manager.load_all_videos()
                 items = [TableItem.from_dict(video) for video in videos]
-                self.table.update_data(items)
-                print(f"更新後の選択行: {[item.row() for item in self.table.selectedItems()]}")
+                self.table.apply_items(items)
                 self.statusBar().showMessage("データ更新完了")
-                print("=== データ更新完了 ===")
             except Exception as e:
-                print(f"データ更新エラー: {str(e)}")
+                self.logger.error(f"データ更新エラー: {str(e)}")
                 QMessageBox.warning(
                     self,
                     "警告",
@@ -192,22 +196,17 @@ class MainWindow(QMainWindow):
             video_id (int): 動画ID
             new_tags (list): 新しいタグリスト
         """
-        print(f"=== タグ編集開始: video_id={video_id} ===")
-        print(f"編集前の選択行: {[item.row() for item in self.table.selectedItems()]}")
         if self.data_manager:
             success = self.data_manager.update_video_tags(video_id, new_tags)
             if success:
-                print("タグ更新成功")
                 self.statusBar().showMessage("タグを更新しました")
             else:
-                print("タグ更新失敗")
+                self.logger.warning(f"タグの更新に失敗しました: video_id={video_id}")
                 QMessageBox.warning(
                     self,
                     "警告",
                     "タグの更新に失敗しました"
                 )
-        print(f"編集後の選択行: {[item.row() for item in self.table.selectedItems()]}")
-        print("=== タグ編集完了 ===")
 
     def _on_character_info_edited(self, video_id: int, gender: str, age_group: str, body_type: str):
         """
@@ -235,17 +234,15 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "警告", "データベースに接続してください")
             return
         try:
-            # データベースから全件取得
-            videos = self.data_manager.load_all_videos()
-            # TableItemリストを作成
-            items_all = [TableItem.from_dict(video) for video in videos]
             # 選択されたIDリストを取得
             selected_ids = set(self._get_selected_video_ids())
+            # データベースから1件ずつ読み込み、出力対象の動画だけTableItemに変換する
+            videos = self.data_manager.iter_videos()
             if selected_ids:
-                export_items = [item for item in items_all if item and item.id in selected_ids]
-            else:
-                export_items = items_all
-            if not export_items:
+                videos = (video for video in videos if video.get('id') in selected_ids)
+            export_items = (item for item in map(TableItem.from_dict, videos) if item)
+            first_item = next(export_items, None)
+            if first_item is None:
                 QMessageBox.information(self, "情報", "エクスポートするデータがありません")
                 return
             # エクスポートディレクトリ設定
@@ -259,7 +256,8 @@ class MainWindow(QMainWindow):
             with open(filepath, "w", newline="", encoding="utf-8") as f:
                 writer = csv.writer(f)
                 # ヘッダー
-                writer.writerow(list(export_items[0].to_dict().keys()))
+                writer.writerow(list(first_item.to_dict().keys()))
+                writer.writerow(list(first_item.to_dict().values()))
                 for item in export_items:
                     writer.writerow(list(item.to_dict().values()))
             QMessageBox.information(self, "情報", f"CSVファイルが作成されました:\n{filepath}")
@@ -270,18 +268,14 @@ class MainWindow(QMainWindow):
     def _get_selected_video_ids(self) -> List[int]:
         """選択された行からvideo_idのリストを取得"""
         video_ids: List[int] = []
-        processed_rows = set()
-        for item in self.table.selectedItems():
-            row = item.row()
-            if row in processed_rows:
-                continue
+        # 選択セルごとではなく、選択行ごとに1つのインデックス（ID列）を取得する
+        for index in self.table.selectionModel().selectedRows(0):
+            row = index.row()
             try:
                 # IDは1列目のテキストとして保存されている
                 id_item = self.table.item(row, 0)
                 if id_item:
-                    vid = int(id_item.text())
-                    video_ids.append(vid)
-                processed_rows.add(row)
+                    video_ids.append(int(id_item.text()))
             except Exception as ex:
                 self.logger.error(f"行 {row} のID取得中にエラー: {ex}", exc_info=True)
         return video_ids 
\ No newline at end of file
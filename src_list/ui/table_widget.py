@@ -2,11 +2,13 @@ from PySide6.QtWidgets import QTableWidget, QTableWidgetItem, QHeaderView
 from PySide6.QtCore import Qt, Signal
 from typing import List, Dict, Any
 from ..models.table_item import TableItem
-from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 編集可能なカラム（性別・年齢層・体型・カスタム1〜3）
+EDITABLE_COLUMNS = frozenset((2, 3, 4, 14, 15, 16))
+
 class CustomTableWidget(QTableWidget):
     tag_edited = Signal(int, list)  # video_id, new_tags
     character_info_edited = Signal(int, str, str, str)  # video_id, gender, age_group, body_type
@@ -57,71 +59,132 @@ class CustomTableWidget(QTableWidget):
         Args:
             items (List[TableItem]): 表示するアイテムのリスト
         """
-        current_time = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-        print(f"=== テーブル更新開始 [{current_time}] ===")
-        print(f"現在選択されている行: {[item.row() for item in self.selectedItems()]}")
+        logger.debug(f"テーブル更新: {len(items)}件")
         
         # ソート機能を一時的に無効化
         self.setSortingEnabled(False)
         
-        # シグナルを一時的に切断
-        self.itemChanged.disconnect(self.on_item_changed)
+        # 全行を書き込み終えるまで再描画とシグナル（セルごとのitemChanged）を止める
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
         
         self._current_items = items
         self.setRowCount(len(items))
         
         try:
             for row, item in enumerate(items):
-                # 基本情報
-                self.setItem(row, 0, self._create_item(str(item.id)))
-                self.setItem(row, 1, self._create_item(item.file_name))
-                # 性別、年齢、体型は編集可能に
-                self.setItem(row, 2, self._create_item(item.character_gender or '', True))
-                self.setItem(row, 3, self._create_item(item.character_age_group or '', True))
-                self.setItem(row, 4, self._create_item(item.character_body_type or '', True))
-
-                # タグから情報を抽出
-                scene = ''
-                intensity = ''
-                tempo = ''
-                loopable = ''
-                other_tags = []
+                for column, text in enumerate(self._row_texts(item)):
+                    self.setItem(row, column, self._create_item(text, column in EDITABLE_COLUMNS))
+        finally:
+            self.blockSignals(False)
+            # ソート機能を再度有効化（並べ替えも再描画前に1回だけ行われる）
+            self.setSortingEnabled(True)
+            self.setUpdatesEnabled(True)
 
-                if item.tags:
-                    for tag in item.tags:
-                        if tag.startswith('scene:'):
-                            scene = tag.replace('scene:', '')
-                        elif tag.startswith('intensity:'):
-                            intensity = tag.replace('intensity:', '')
-                        elif tag.startswith('tempo:'):
-                            tempo = tag.replace('tempo:', '')
-                        elif tag.startswith('loopable:'):
-                            loopable = tag.replace('loopable:', '')
-                        else:
-                            other_tags.append(tag)
+    def apply_items(self, items: List[TableItem]):
+        """
+        最新のアイテムをテーブルに反映する
+        
+        表示中の動画と同じ構成なら内容が変わった行だけ書き換え、
+        件数や動画が変わっていれば全体を作り直す
+        Args:
+            items (List[TableItem]): 表示するアイテムのリスト
+        """
+        current = {item.id: item for item in self._current_items if item}
+        if len(current) == len(items) and all(item and item.id in current for item in items):
+            self.refresh_rows([item for item in items if item != current[item.id]])
+        else:
+            self.update_data(items)
 
-                # 抽出した情報を設定
-                self.setItem(row, 5, self._create_item(scene))
-                self.setItem(row, 6, self._create_item(intensity))
-                self.setItem(row, 7, self._create_item(tempo))
-                self.setItem(row, 8, self._create_item(loopable))
-                self.setItem(row, 9, self._create_item(item.movement_description or ''))
-                self.setItem(row, 10, self._create_item(item.posture_detail or ''))
-                self.setItem(row, 11, self._create_item(item.initial_pose or ''))
-                self.setItem(row, 12, self._create_item(item.final_pose or ''))
-                self.setItem(row, 13, self._create_item(item.animation_file_name or ''))
-                self.setItem(row, 14, self._create_item(item.param_01 or '', True))
-                self.setItem(row, 15, self._create_item(item.param_02 or '', True))
-                self.setItem(row, 16, self._create_item(item.param_03 or '', True))
-                self.setItem(row, 17, self._create_item(', '.join(other_tags)))
+    def refresh_rows(self, items: List[TableItem]):
+        """
+        表示中の行のうち、指定されたアイテムと同じIDの行だけ内容を書き換える
+        
+        行の作り直しは行わず、値が変わったセルのテキストだけを更新する
+        Args:
+            items (List[TableItem]): 最新のアイテムのリスト（表示されていないIDは無視）
+        """
+        if not items:
+            return
+        
+        self.setSortingEnabled(False)
+        self.setUpdatesEnabled(False)
+        self.blockSignals(True)
+        try:
+            # 並べ替え後の表示位置で探す
+            row_by_id = {}
+            for row in range(self.rowCount()):
+                cell = self.item(row, 0)
+                if cell:
+                    row_by_id[cell.text()] = row
+            
+            current_by_id = {current.id: i for i, current in enumerate(self._current_items)}
+            for item in items:
+                row = row_by_id.get(str(item.id))
+                if row is None:
+                    continue
+                for column, text in enumerate(self._row_texts(item)):
+                    cell = self.item(row, column)
+                    if cell is None:
+                        self.setItem(row, column, self._create_item(text, column in EDITABLE_COLUMNS))
+                    elif cell.text() != text:
+                        cell.setText(text)
+                if item.id in current_by_id:
+                    self._current_items[current_by_id[item.id]] = item
         finally:
-            current_time = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-            print(f"=== テーブル更新完了 [{current_time}] ===")
-            print(f"更新後の選択されている行: {[item.row() for item in self.selectedItems()]}")
-            # シグナルを再接続
-            self.itemChanged.connect(self.on_item_changed)
-            # ソート機能を再度有効化
+            self.blockSignals(False)
             self.setSortingEnabled(True)
+            self.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _row_texts(item: TableItem) -> List[str]:
+        """
+        1行分の各カラムに表示する文字列を作成
+        Args:
+            item (TableItem): 表示するアイテム
+        Returns:
+            List[str]: カラム順の文字列のリスト
+        """
+        # タグから情報を抽出
+        scene = ''
+        intensity = ''
+        tempo = ''
+        loopable = ''
+        other_tags = []
+
+        if item.tags:
+            for tag in item.tags:
+                if tag.startswith('scene:'):
+                    scene = tag.replace('scene:', '')
+                elif tag.startswith('intensity:'):
+                    intensity = tag.replace('intensity:', '')
+                elif tag.startswith('tempo:'):
+                    tempo = tag.replace('tempo:', '')
+                elif tag.startswith('loopable:'):
+                    loopable = tag.replace('loopable:', '')
+                else:
+                    other_tags.append(tag)
+
+        return [
+            str(item.id),
+            item.file_name,
+            item.character_gender or '',
+            item.character_age_group or '',
+            item.character_body_type or '',
+            scene,
+            intensity,
+            tempo,
+            loopable,
+            item.movement_description or '',
+            item.posture_detail or '',
+            item.initial_pose or '',
+            item.final_pose or '',
+            item.animation_file_name or '',
+            item.param_01 or '',
+            item.param_02 or '',
+            item.param_03 or '',
+            ', '.join(other_tags)
+        ]
 
     def _create_item(self, text: str, editable: bool = False) -> QTableWidgetItem:
         """
@@ -179,11 +242,11 @@ class CustomTableWidget(QTableWidget):
                 elif column == 4:
                     body_type = item.text()
                 
-                print(f"キャラクター情報を更新: ID={video_id}, 性別={gender}, 年齢={age_group}, 体型={body_type}")
+                logger.debug(f"キャラクター情報を更新: ID={video_id}, 性別={gender}, 年齢={age_group}, 体型={body_type}")
                 self.character_info_edited.emit(video_id, gender, age_group, body_type)
                 
             except (ValueError, AttributeError) as e:
-                print(f"キャラクター情報の更新中にエラーが発生: {e}")
+                logger.error(f"キャラクター情報の更新中にエラーが発生: {e}")
             
         elif column == 14:  # その他タグカラム
             try:
@@ -203,35 +266,9 @@ class CustomTableWidget(QTableWidget):
                 # すべてのタグを結合
                 new_tags = [tag for tag in [scene, intensity, tempo, loopable] + other_tags if tag]
                 
-                print(f"タグを更新: ID={video_id}, タグ={new_tags}")
+                logger.debug(f"タグを更新: ID={video_id}, タグ={new_tags}")
                 self.tag_edited.emit(video_id, new_tags)
                 item.setFlags(item.flags() & ~Qt.ItemIsEditable)  # 編集モードを解除
                 
             except (ValueError, AttributeError) as e:
-                print(f"タグの更新中にエラーが発生: {e}") 
-
-    def refresh_table(self):
-        """テーブルの定期更新"""
-        try:
-            current_time = datetime.now().strftime('%H:%M:%S.%f')[:-3]
-            print(f"=== テーブル再描画開始 [{current_time}] ===")
-            print(f"再描画前の選択行: {[item.row() for item in self.selectedItems()]}")
-            videos = self.db.get_all_videos()
-            
-            # 現在のテーブルの状態を保存
-            selected_rows = [item.row() for item in self.selectedItems()]
-            scroll_position = self.table.verticalScrollBar().value()
-            
-            print(f"保存した選択行: {selected_rows}")
-            self.update_data(videos)
-            
-            # 選択状態を復元
-            for row in selected_rows:
-                if row < self.table.rowCount():
-                    self.table.selectRow(row)
-            
-            print(f"再描画後の選択行: {[item.row() for item in self.selectedItems()]}")
-            # スクロール位置を復元
-            self.table.verticalScrollBar().setValue(scroll_position)
-        except Exception as e:
-            print(f"テーブルの再描画中にエラーが発生: {e}") 
\ No newline at end of file
+                logger.error(f"タグの更新中にエラーが発生: {e}")